@@ -3,51 +3,81 @@ Sistema de Nómina - Archivo Principal
 Demuestra el funcionamiento del sistema con ejemplos de todos los tipos de empleados.
 """
 
+import io
+import sys
 from datetime import date
+from functools import lru_cache
 from src.models.empleado_asalariado import EmpleadoAsalariado
 from src.models.empleado_por_horas import EmpleadoPorHoras
 from src.models.empleado_por_comision import EmpleadoPorComision
 from src.models.empleado_temporal import EmpleadoTemporal
 
 
-def imprimir_separador():
-    """Imprime una línea separadora para mejor visualización"""
-    print("\n" + "=" * 80 + "\n")
+def imprimir_separador(w):
+    """
+    Escribe una línea separadora para mejor visualización.
+    
+    Args:
+        w: Función que escribe texto en el reporte (ej: StringIO.write)
+    """
+    w("\n" + "=" * 80 + "\n\n")
 
 
-def mostrar_detalle_nomina(empleado):
+@lru_cache(maxsize=None)
+def _etiqueta(clave: str) -> str:
     """
-    Muestra el detalle completo de la nómina de un empleado.
+    Convierte una clave del detalle en su etiqueta rellenada con puntos.
+    Se calcula una sola vez por clave.
+    
+    Args:
+        clave (str): Clave del detalle de nómina (ej: 'salario_bruto')
+        
+    Returns:
+        str: Etiqueta de 40 caracteres (ej: 'Salario Bruto.....')
+    """
+    return f"{clave.replace('_', ' ').title():.<40}"
+
+
+def mostrar_detalle_nomina(empleado, w):
+    """
+    Escribe el detalle completo de la nómina de un empleado.
     
     Args:
         empleado: Instancia de cualquier tipo de empleado
+        w: Función que escribe texto en el reporte (ej: StringIO.write)
     """
-    print(f"📋 DETALLE DE NÓMINA")
-    print(f"{'─' * 80}")
+    lineas = [f"📋 DETALLE DE NÓMINA", f"{'─' * 80}"]
     
     detalle = empleado.obtener_detalle_nomina()
     
     for clave, valor in detalle.items():
         if isinstance(valor, float):
-            print(f"{clave.replace('_', ' ').title():.<40} ${valor:,.2f}")
+            lineas.append(f"{_etiqueta(clave)} ${valor:,.2f}")
         else:
-            print(f"{clave.replace('_', ' ').title():.<40} {valor}")
+            lineas.append(f"{_etiqueta(clave)} {valor}")
     
-    imprimir_separador()
+    lineas.append("")
+    w("\n".join(lineas))
+    imprimir_separador(w)
 
 
 def main():
-    """Función principal que demuestra el uso del sistema de nómina"""
+    """
+    Función principal que demuestra el uso del sistema de nómina.
+    El reporte se arma en memoria y se escribe en la salida de una sola vez.
+    """
+    out = io.StringIO()
+    w = out.write
     
-    print("\n🏢 SISTEMA DE NÓMINA - DEMOSTRACIÓN")
-    imprimir_separador()
+    w("\n🏢 SISTEMA DE NÓMINA - DEMOSTRACIÓN\n")
+    imprimir_separador(w)
     
     # =============================================================================
     # EJEMPLO 1: Empleado Asalariado
     # =============================================================================
-    print("👤 EJEMPLO 1: EMPLEADO ASALARIADO")
-    print("Salario fijo con bono por antigüedad (si > 5 años)")
-    imprimir_separador()
+    w("👤 EJEMPLO 1: EMPLEADO ASALARIADO\n")
+    w("Salario fijo con bono por antigüedad (si > 5 años)\n")
+    imprimir_separador(w)
     
     # Empleado con más de 5 años (recibe bono de antigüedad)
     emp_asalariado1 = EmpleadoAsalariado(
@@ -57,9 +87,9 @@ def main():
         salario_mensual=5_000_000
     )
     
-    print(f"Empleado: {emp_asalariado1.nombre}")
-    print(f"Antigüedad: {emp_asalariado1.obtener_antiguedad_años()} años")
-    mostrar_detalle_nomina(emp_asalariado1)
+    w(f"Empleado: {emp_asalariado1.nombre}\n")
+    w(f"Antigüedad: {emp_asalariado1.obtener_antiguedad_años()} años\n")
+    mostrar_detalle_nomina(emp_asalariado1, w)
     
     # Empleado con menos de 5 años (NO recibe bono de antigüedad)
     emp_asalariado2 = EmpleadoAsalariado(
@@ -69,16 +99,16 @@ def main():
         salario_mensual=4_500_000
     )
     
-    print(f"Empleado: {emp_asalariado2.nombre}")
-    print(f"Antigüedad: {emp_asalariado2.obtener_antiguedad_años()} años")
-    mostrar_detalle_nomina(emp_asalariado2)
+    w(f"Empleado: {emp_asalariado2.nombre}\n")
+    w(f"Antigüedad: {emp_asalariado2.obtener_antiguedad_años()} años\n")
+    mostrar_detalle_nomina(emp_asalariado2, w)
     
     # =============================================================================
     # EJEMPLO 2: Empleado Por Horas
     # =============================================================================
-    print("👤 EJEMPLO 2: EMPLEADO POR HORAS")
-    print("Pago por horas + horas extras (1.5x) + fondo de ahorro (si > 1 año)")
-    imprimir_separador()
+    w("👤 EJEMPLO 2: EMPLEADO POR HORAS\n")
+    w("Pago por horas + horas extras (1.5x) + fondo de ahorro (si > 1 año)\n")
+    imprimir_separador(w)
     
     # Empleado con horas extras y fondo de ahorro
     emp_por_horas1 = EmpleadoPorHoras(
@@ -90,10 +120,10 @@ def main():
         acepta_fondo_ahorro=True
     )
     
-    print(f"Empleado: {emp_por_horas1.nombre}")
-    print(f"Tarifa por hora: ${emp_por_horas1.tarifa_por_hora:,.2f}")
-    print(f"Horas trabajadas: {emp_por_horas1.horas_trabajadas}")
-    mostrar_detalle_nomina(emp_por_horas1)
+    w(f"Empleado: {emp_por_horas1.nombre}\n")
+    w(f"Tarifa por hora: ${emp_por_horas1.tarifa_por_hora:,.2f}\n")
+    w(f"Horas trabajadas: {emp_por_horas1.horas_trabajadas}\n")
+    mostrar_detalle_nomina(emp_por_horas1, w)
     
     # Empleado sin horas extras
     emp_por_horas2 = EmpleadoPorHoras(
@@ -105,17 +135,17 @@ def main():
         acepta_fondo_ahorro=False
     )
     
-    print(f"Empleado: {emp_por_horas2.nombre}")
-    print(f"Tarifa por hora: ${emp_por_horas2.tarifa_por_hora:,.2f}")
-    print(f"Horas trabajadas: {emp_por_horas2.horas_trabajadas}")
-    mostrar_detalle_nomina(emp_por_horas2)
+    w(f"Empleado: {emp_por_horas2.nombre}\n")
+    w(f"Tarifa por hora: ${emp_por_horas2.tarifa_por_hora:,.2f}\n")
+    w(f"Horas trabajadas: {emp_por_horas2.horas_trabajadas}\n")
+    mostrar_detalle_nomina(emp_por_horas2, w)
     
     # =============================================================================
     # EJEMPLO 3: Empleado Por Comisión
     # =============================================================================
-    print("👤 EJEMPLO 3: EMPLEADO POR COMISIÓN")
-    print("Salario base + comisión + bono por ventas altas (si > $20M)")
-    imprimir_separador()
+    w("👤 EJEMPLO 3: EMPLEADO POR COMISIÓN\n")
+    w("Salario base + comisión + bono por ventas altas (si > $20M)\n")
+    imprimir_separador(w)
     
     # Empleado con ventas altas (recibe bono adicional)
     emp_comision1 = EmpleadoPorComision(
@@ -127,11 +157,11 @@ def main():
         ventas_mes=25_000_000  # Supera los $20M
     )
     
-    print(f"Empleado: {emp_comision1.nombre}")
-    print(f"Salario base: ${emp_comision1.salario_base:,.2f}")
-    print(f"Comisión: {emp_comision1.porcentaje_comision * 100}%")
-    print(f"Ventas del mes: ${emp_comision1.ventas_mes:,.2f}")
-    mostrar_detalle_nomina(emp_comision1)
+    w(f"Empleado: {emp_comision1.nombre}\n")
+    w(f"Salario base: ${emp_comision1.salario_base:,.2f}\n")
+    w(f"Comisión: {emp_comision1.porcentaje_comision * 100}%\n")
+    w(f"Ventas del mes: ${emp_comision1.ventas_mes:,.2f}\n")
+    mostrar_detalle_nomina(emp_comision1, w)
     
     # Empleado con ventas bajas (NO recibe bono adicional)
     emp_comision2 = EmpleadoPorComision(
@@ -143,18 +173,18 @@ def main():
         ventas_mes=15_000_000  # No supera los $20M
     )
     
-    print(f"Empleado: {emp_comision2.nombre}")
-    print(f"Salario base: ${emp_comision2.salario_base:,.2f}")
-    print(f"Comisión: {emp_comision2.porcentaje_comision * 100}%")
-    print(f"Ventas del mes: ${emp_comision2.ventas_mes:,.2f}")
-    mostrar_detalle_nomina(emp_comision2)
+    w(f"Empleado: {emp_comision2.nombre}\n")
+    w(f"Salario base: ${emp_comision2.salario_base:,.2f}\n")
+    w(f"Comisión: {emp_comision2.porcentaje_comision * 100}%\n")
+    w(f"Ventas del mes: ${emp_comision2.ventas_mes:,.2f}\n")
+    mostrar_detalle_nomina(emp_comision2, w)
     
     # =============================================================================
     # EJEMPLO 4: Empleado Temporal
     # =============================================================================
-    print("👤 EJEMPLO 4: EMPLEADO TEMPORAL")
-    print("Contrato por tiempo definido, sin bonos ni beneficios")
-    imprimir_separador()
+    w("👤 EJEMPLO 4: EMPLEADO TEMPORAL\n")
+    w("Contrato por tiempo definido, sin bonos ni beneficios\n")
+    imprimir_separador(w)
     
     emp_temporal = EmpleadoTemporal(
         id_empleado="007",
@@ -164,17 +194,17 @@ def main():
         fecha_fin_contrato=date(2025, 12, 31)
     )
     
-    print(f"Empleado: {emp_temporal.nombre}")
-    print(f"Salario: ${emp_temporal.salario_mensual:,.2f}")
-    print(f"Contrato vigente: {'Sí' if emp_temporal.contrato_vigente() else 'No'}")
-    print(f"Días restantes: {emp_temporal.dias_restantes_contrato()}")
-    mostrar_detalle_nomina(emp_temporal)
+    w(f"Empleado: {emp_temporal.nombre}\n")
+    w(f"Salario: ${emp_temporal.salario_mensual:,.2f}\n")
+    w(f"Contrato vigente: {'Sí' if emp_temporal.contrato_vigente() else 'No'}\n")
+    w(f"Días restantes: {emp_temporal.dias_restantes_contrato()}\n")
+    mostrar_detalle_nomina(emp_temporal, w)
     
     # =============================================================================
     # RESUMEN FINAL
     # =============================================================================
-    print("📊 RESUMEN DE NÓMINA TOTAL")
-    imprimir_separador()
+    w("📊 RESUMEN DE NÓMINA TOTAL\n")
+    imprimir_separador(w)
     
     empleados = [
         emp_asalariado1, emp_asalariado2,
@@ -185,13 +215,15 @@ def main():
     
     total_salarios = sum(emp.calcular_salario_neto() for emp in empleados)
     
-    print(f"{'Total de empleados:':.<40} {len(empleados)}")
-    print(f"{'Total de nómina mensual:':.<40} ${total_salarios:,.2f}")
+    w(f"{'Total de empleados:':.<40} {len(empleados)}\n")
+    w(f"{'Total de nómina mensual:':.<40} ${total_salarios:,.2f}\n")
+    
+    imprimir_separador(w)
+    w("✅ Sistema de nómina funcionando correctamente\n")
+    w("📝 Todos los principios SOLID implementados\n")
+    w("🧪 Listo para pruebas unitarias\n\n")
     
-    imprimir_separador()
-    print("✅ Sistema de nómina funcionando correctamente")
-    print("📝 Todos los principios SOLID implementados")
-    print("🧪 Listo para pruebas unitarias\n")
+    sys.stdout.write(out.getvalue())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,89 @@
+"""
+Coeficientes precalculados del salario neto por cohorte.
+
+Dentro de una cohorte (mismo tipo de empleado y misma condición de bono o
+de fondo de ahorro) el salario neto es lineal sobre una sola base:
+    neto = base * factor + constante
+Las deducciones y el porcentaje del bono se pliegan en el factor, de modo
+que el cálculo por empleado queda en una multiplicación y una suma.
+
+Cada función arma, al momento de la llamada, el arreglo de reglas que
+reciben los kernels por lote a partir de las constantes vigentes de las
+clases de empleados (ver _kernels.py).
+
+Los factores de cada cohorte van en pares indexados con la condición:
+0 si no la cumple, 1 si la cumple.
+"""
+
+import numpy as np
+
+from .empleado import Empleado
+from .empleado_asalariado import EmpleadoAsalariado
+from .empleado_por_horas import EmpleadoPorHoras
+from .empleado_por_comision import EmpleadoPorComision
+
+
+def _factor_neto() -> float:
+    """Fracción del salario bruto que queda después de las deducciones"""
+    return 1 - Empleado.PORCENTAJE_DEDUCCIONES
+
+
+def reglas_asalariado() -> np.ndarray:
+    """
+    Reglas de los asalariados: base = salario mensual, cohorte = más de
+    AÑOS_MINIMOS_BONO años de antigüedad.
+
+    Returns:
+        np.ndarray: [años mínimos del bono, factor sin bono, factor con bono,
+        bono de alimentación]
+    """
+    return np.array([
+        EmpleadoAsalariado.AÑOS_MINIMOS_BONO,
+        _factor_neto(),
+        _factor_neto() + EmpleadoAsalariado.PORCENTAJE_BONO_ANTIGUEDAD,
+        EmpleadoAsalariado.BONO_ALIMENTACION,
+    ], dtype=np.float64)
+
+
+def reglas_por_horas() -> np.ndarray:
+    """
+    Reglas de los empleados por horas: base = salario bruto, cohorte = acepta
+    el fondo y tiene más de AÑOS_MINIMOS_FONDO años de antigüedad.
+
+    Returns:
+        np.ndarray: [límite de horas normales, multiplicador de horas extras,
+        años mínimos del fondo, factor sin fondo, factor con fondo]
+    """
+    return np.array([
+        EmpleadoPorHoras.HORAS_NORMALES_LIMITE,
+        EmpleadoPorHoras.MULTIPLICADOR_HORAS_EXTRAS,
+        EmpleadoPorHoras.AÑOS_MINIMOS_FONDO,
+        _factor_neto(),
+        _factor_neto() + EmpleadoPorHoras.PORCENTAJE_FONDO_AHORRO,
+    ], dtype=np.float64)
+
+
+def reglas_por_comision() -> np.ndarray:
+    """
+    Reglas de los empleados por comisión.
+
+    Returns:
+        np.ndarray: [porcentaje de deducciones, bono de alimentación,
+        ventas mínimas del bono, porcentaje del bono por ventas]
+    """
+    return np.array([
+        Empleado.PORCENTAJE_DEDUCCIONES,
+        EmpleadoPorComision.BONO_ALIMENTACION,
+        EmpleadoPorComision.VENTAS_MINIMAS_BONO,
+        EmpleadoPorComision.PORCENTAJE_BONO_VENTAS,
+    ], dtype=np.float64)
+
+
+def reglas_temporal() -> np.ndarray:
+    """
+    Reglas de los empleados temporales (sin beneficios).
+
+    Returns:
+        np.ndarray: [porcentaje de deducciones]
+    """
+    return np.array([Empleado.PORCENTAJE_DEDUCCIONES], dtype=np.float64)
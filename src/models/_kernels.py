@@ -0,0 +1,117 @@
+"""
+Kernels numéricos compilados con Numba para el cálculo de la nómina.
+Replican las reglas de negocio de cada tipo de empleado sobre valores
+escalares, sin despacho de métodos ni búsqueda de atributos.
+
+Los kernels por lote recorren columnas completas en paralelo con prange,
+en varios núcleos, escribiendo los salarios netos en un arreglo de salida.
+Todos se compilan con nogil=True, de modo que un hilo puede calcular un lote
+mientras otros hilos de Python hacen E/S (por ejemplo, escribir reportes).
+
+Las firmas explícitas hacen que la compilación ocurra al importar el módulo
+y no en la primera llamada; con cache=True el código generado se guarda en
+disco, así que solo la primera ejecución paga el costo del JIT y las
+siguientes corren a velocidad de código nativo. Para que ninguna ejecución
+lo pague, el caché puede llenarse al instalar:
+
+    python -m src.models._kernels
+
+Si la carpeta del proyecto no admite escritura, la variable de entorno
+NUMBA_CACHE_DIR indica otra ubicación para el caché.
+
+Las reglas de negocio (porcentajes, umbrales y factores) llegan como un
+arreglo `reglas` armado en _coeficientes.py al momento de la llamada, nunca
+como variables globales: Numba las congelaría en el código del caché y un
+cambio de regla en las clases de empleados no lo invalidaría.
+
+Las reglas condicionales (bonos, fondo de ahorro) se escriben sin saltos,
+multiplicando por la condición como 0/1; con fastmath y sin verificación de
+límites LLVM puede vectorizar los ciclos con instrucciones FMA. Para los
+asalariados y los empleados por horas la condición solo elige el factor
+precalculado de su cohorte.
+"""
+
+from numba import njit, prange, void, float64, int32, boolean
+
+# Opciones comunes de compilación
+_OPCIONES_JIT = {'cache': True, 'fastmath': True, 'boundscheck': False, 'nogil': True}
+
+
+@njit(float64(float64, float64, float64), **_OPCIONES_JIT)
+def neto(salario_bruto, beneficios, porcentaje_deducciones):
+    """Salario bruto + beneficios - deducciones, nunca negativo"""
+    deducciones = salario_bruto * porcentaje_deducciones
+    return max(0.0, salario_bruto + beneficios - deducciones)
+
+
+@njit(float64(float64[::1], float64, int32), **_OPCIONES_JIT)
+def neto_asalariado(reglas, salario, antiguedad):
+    """Salario neto de un empleado asalariado (reglas_asalariado())"""
+    cohorte = int(antiguedad > reglas[0])
+    return max(0.0, salario * reglas[1 + cohorte] + reglas[3])
+
+
+@njit(float64(float64[::1], float64, float64, int32, boolean), **_OPCIONES_JIT)
+def neto_por_horas(reglas, tarifa, horas, antiguedad, acepta_fondo):
+    """Salario neto de un empleado por horas (reglas_por_horas())"""
+    horas_normales = min(horas, reglas[0])
+    horas_extras = max(horas - reglas[0], 0.0)
+    salario_bruto = horas_normales * tarifa + horas_extras * tarifa * reglas[1]
+
+    cohorte = int((antiguedad > reglas[2]) & acepta_fondo)
+    return max(0.0, salario_bruto * reglas[3 + cohorte])
+
+
+@njit(float64(float64[::1], float64, float64, float64), **_OPCIONES_JIT)
+def neto_por_comision(reglas, salario_base, porcentaje_comision, ventas):
+    """Salario neto de un empleado por comisión (reglas_por_comision())"""
+    salario_bruto = salario_base + ventas * porcentaje_comision
+
+    bono_ventas = ventas * reglas[3] * (ventas > reglas[2])
+    return neto(salario_bruto, reglas[1] + bono_ventas, reglas[0])
+
+
+@njit(float64(float64[::1], float64), **_OPCIONES_JIT)
+def neto_temporal(reglas, salario):
+    """Salario neto de un empleado temporal, sin beneficios (reglas_temporal())"""
+    return neto(salario, 0.0, reglas[0])
+
+
+@njit(void(float64[::1], float64[::1], int32[::1], float64[::1]),
+      parallel=True, **_OPCIONES_JIT)
+def lote_neto_asalariado(reglas, salario, antiguedad, netos):
+    """Salarios netos de un lote de empleados asalariados"""
+    for i in prange(salario.shape[0]):
+        netos[i] = neto_asalariado(reglas, salario[i], antiguedad[i])
+
+
+@njit(void(float64[::1], float64[::1], float64[::1], int32[::1], boolean[::1], float64[::1]),
+      parallel=True, **_OPCIONES_JIT)
+def lote_neto_por_horas(reglas, tarifa, horas, antiguedad, acepta_fondo, netos):
+    """Salarios netos de un lote de empleados por horas"""
+    for i in prange(tarifa.shape[0]):
+        netos[i] = neto_por_horas(reglas, tarifa[i], horas[i], antiguedad[i], acepta_fondo[i])
+
+
+@njit(void(float64[::1], float64[::1], float64[::1], float64[::1], float64[::1]),
+      parallel=True, **_OPCIONES_JIT)
+def lote_neto_por_comision(reglas, salario_base, porcentaje_comision, ventas, netos):
+    """Salarios netos de un lote de empleados por comisión"""
+    for i in prange(salario_base.shape[0]):
+        netos[i] = neto_por_comision(reglas, salario_base[i], porcentaje_comision[i], ventas[i])
+
+
+@njit(void(float64[::1], float64[::1], float64[::1]), parallel=True, **_OPCIONES_JIT)
+def lote_neto_temporal(reglas, salario, netos):
+    """Salarios netos de un lote de empleados temporales"""
+    for i in prange(salario.shape[0]):
+        netos[i] = neto_temporal(reglas, salario[i])
+
+
+if __name__ == "__main__":
+    # Importar el módulo ya compiló y guardó en caché todos los kernels
+    for kernel in (neto, neto_asalariado, neto_por_horas, neto_por_comision, neto_temporal,
+                   lote_neto_asalariado, lote_neto_por_horas, lote_neto_por_comision,
+                   lote_neto_temporal):
+        for firma in kernel.signatures:
+            print(f"{kernel.__name__}{firma}")
@@ -1,17 +1,30 @@
 """
-Clase base abstracta para todos los tipos de empleados.
+Clase base para todos los tipos de empleados.
 Implementa principios SOLID: Single Responsibility y Open/Closed.
 """
 
-from abc import ABC, abstractmethod
 from datetime import date
+from .resultado_nomina import ResultadoNomina
 
-class Empleado(ABC):
+class Empleado:
     """
-    Clase base abstracta que representa un empleado genérico.
+    Clase base que representa un empleado genérico.
     Define los atributos y métodos comunes a todos los empleados.
+    Cada subclase debe implementar calcular_salario_bruto() y
+    calcular_beneficios().
     """
     
+    # Atributos de instancia (sin __dict__ por empleado)
+    __slots__ = ('_id_empleado', '_nombre', '_fecha_ingreso',
+                 '_antiguedad_cache', '_nomina_cache')
+    
+    # Constantes
+    PORCENTAJE_DEDUCCIONES = 0.04
+    
+    # Si la nómina depende de la fecha (antigüedad). Las subclases cuya
+    # nómina no depende de ella lo desactivan para no consultar el reloj.
+    NOMINA_SEGUN_FECHA = True
+    
     def __init__(self, id_empleado: str, nombre: str, fecha_ingreso: date):
         """
         Constructor de la clase Empleado.
@@ -24,6 +37,8 @@ class Empleado(ABC):
         self._id_empleado = id_empleado
         self._nombre = nombre
         self._fecha_ingreso = fecha_ingreso
+        self._antiguedad_cache = None  # (fecha de referencia, años)
+        self._nomina_cache = None  # (fecha de referencia, ResultadoNomina)
         self._validar_datos()
     
     def _validar_datos(self):
@@ -39,26 +54,25 @@ class Empleado(ABC):
         if self._fecha_ingreso > date.today():
             raise ValueError("La fecha de ingreso no puede ser futura")
     
-    @abstractmethod
     def calcular_salario_bruto(self) -> float:
         """
-        Método abstracto para calcular el salario bruto.
+        Calcula el salario bruto.
         Cada tipo de empleado implementará su propia lógica.
         
         Returns:
             float: Salario bruto del empleado
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def calcular_beneficios(self) -> float:
         """
-        Método abstracto para calcular beneficios adicionales.
+        Calcula los beneficios adicionales.
+        Cada tipo de empleado implementará su propia lógica.
         
         Returns:
             float: Total de beneficios
         """
-        pass
+        raise NotImplementedError
     
     def calcular_deducciones(self, salario_bruto: float) -> float:
         """
@@ -71,39 +85,103 @@ class Empleado(ABC):
         Returns:
             float: Total de deducciones
         """
-        return salario_bruto * 0.04
+        return salario_bruto * self.PORCENTAJE_DEDUCCIONES
     
-    def calcular_salario_neto(self) -> float:
+    def _liquidar(self, salario_bruto: float, beneficios: float, **conceptos) -> ResultadoNomina:
         """
-        Calcula el salario neto del empleado.
+        Aplica las deducciones y arma el resultado de la nómina.
         Salario Neto = Salario Bruto + Beneficios - Deducciones
         
+        Args:
+            salario_bruto (float): Salario bruto del empleado
+            beneficios (float): Total de beneficios
+            **conceptos: Conceptos propios del tipo de empleado
+            
         Returns:
-            float: Salario neto (nunca negativo)
+            ResultadoNomina: Resultado con el salario neto (nunca negativo)
         """
-        salario_bruto = self.calcular_salario_bruto()
-        beneficios = self.calcular_beneficios()
         deducciones = self.calcular_deducciones(salario_bruto)
-        
         salario_neto = salario_bruto + beneficios - deducciones
         
         # Validación: el salario neto no puede ser negativo
-        return max(0, salario_neto)
+        if salario_neto < 0:
+            salario_neto = 0
+        
+        return ResultadoNomina(salario_bruto, beneficios, deducciones,
+                               salario_neto, conceptos)
+    
+    def _calcular_nomina(self, hoy: date) -> ResultadoNomina:
+        """
+        Calcula todos los conceptos de la nómina en una sola pasada.
+        Las subclases la redefinen para agregar sus conceptos propios y
+        pasan hoy a los cálculos que dependen de la antigüedad.
+        
+        Args:
+            hoy (date | None): Fecha de referencia del cálculo (None si
+                NOMINA_SEGUN_FECHA es falso)
+            
+        Returns:
+            ResultadoNomina: Resultado de la nómina
+        """
+        return self._liquidar(self.calcular_salario_bruto(), self.calcular_beneficios())
+    
+    def calcular_nomina(self) -> ResultadoNomina:
+        """
+        Obtiene el resultado de la nómina del empleado.
+        Se calcula una vez por día (o una sola vez si NOMINA_SEGUN_FECHA es
+        falso) y se reutiliza hasta que cambien los datos.
+        
+        Returns:
+            ResultadoNomina: Resultado de la nómina
+        """
+        hoy = date.today() if self.NOMINA_SEGUN_FECHA else None
+        cache = self._nomina_cache
+        if cache is None or cache[0] != hoy:
+            cache = self._nomina_cache = (hoy, self._calcular_nomina(hoy))
+        return cache[1]
+    
+    def _invalidar_nomina(self):
+        """
+        Descarta el resultado memorizado tras modificar los datos del empleado.
+        Las subclases la extienden para descartar también sus cálculos memorizados.
+        """
+        self._nomina_cache = None
+    
+    def calcular_salario_neto(self) -> float:
+        """
+        Calcula el salario neto del empleado.
+        Salario Neto = Salario Bruto + Beneficios - Deducciones
+        
+        Returns:
+            float: Salario neto (nunca negativo)
+        """
+        return self.calcular_nomina().salario_neto
     
-    def obtener_antiguedad_años(self) -> int:
+    def obtener_antiguedad_años(self, hoy: date | None = None) -> int:
         """
         Calcula los años de antigüedad del empleado.
+        El resultado se memoriza para la última fecha de referencia usada.
+        
+        Args:
+            hoy (date, opcional): Fecha de referencia (por defecto, la fecha actual)
         
         Returns:
             int: Años completos trabajados
         """
-        hoy = date.today()
-        años = hoy.year - self._fecha_ingreso.year
+        if hoy is None:
+            hoy = date.today()
+        
+        if self._antiguedad_cache is not None and self._antiguedad_cache[0] == hoy:
+            return self._antiguedad_cache[1]
+        
+        ingreso = self._fecha_ingreso
         
-        # Ajustar si aún no ha cumplido años este año
-        if (hoy.month, hoy.day) < (self._fecha_ingreso.month, self._fecha_ingreso.day):
-            años -= 1
+        # Restar 1 si aún no ha cumplido años este año (la comparación vale 0 o 1).
+        # Mes y día se comparan como un entero MMDD, sin construir tuplas.
+        años = (hoy.year - ingreso.year
+                - (hoy.month * 100 + hoy.day < ingreso.month * 100 + ingreso.day))
         
+        self._antiguedad_cache = (hoy, años)
         return años
     
     # Getters
@@ -4,6 +4,7 @@ Clase para empleados con salario fijo mensual.
 
 from datetime import date
 from .empleado import Empleado
+from .resultado_nomina import ResultadoNomina
 
 
 class EmpleadoAsalariado(Empleado):
@@ -16,6 +17,8 @@ class EmpleadoAsalariado(Empleado):
     - Bono de alimentación de $1,000,000/mes
     """
     
+    __slots__ = ('_salario_mensual',)
+    
     # Constantes de la clase
     BONO_ALIMENTACION = 1_000_000
     PORCENTAJE_BONO_ANTIGUEDAD = 0.10
@@ -50,15 +53,18 @@ class EmpleadoAsalariado(Empleado):
         """
         return self._salario_mensual
     
-    def _calcular_bono_antiguedad(self) -> float:
+    def _calcular_bono_antiguedad(self, hoy: date | None = None) -> float:
         """
         Calcula el bono por antigüedad.
         Se otorga 10% del salario si tiene más de 5 años.
         
+        Args:
+            hoy (date, opcional): Fecha de referencia para la antigüedad
+        
         Returns:
             float: Monto del bono por antigüedad
         """
-        if self.obtener_antiguedad_años() > self.AÑOS_MINIMOS_BONO:
+        if self.obtener_antiguedad_años(hoy) > self.AÑOS_MINIMOS_BONO:
             return self._salario_mensual * self.PORCENTAJE_BONO_ANTIGUEDAD
         return 0
     
@@ -73,6 +79,23 @@ class EmpleadoAsalariado(Empleado):
         bono_antiguedad = self._calcular_bono_antiguedad()
         return self.BONO_ALIMENTACION + bono_antiguedad
     
+    def _calcular_nomina(self, hoy: date) -> ResultadoNomina:
+        """
+        Calcula todos los conceptos de la nómina en una sola pasada.
+        
+        Args:
+            hoy (date): Fecha de referencia del cálculo
+            
+        Returns:
+            ResultadoNomina: Resultado de la nómina
+        """
+        bono_antiguedad = self._calcular_bono_antiguedad(hoy)
+        return self._liquidar(
+            self.calcular_salario_bruto(),
+            self.BONO_ALIMENTACION + bono_antiguedad,
+            bono_antiguedad=bono_antiguedad
+        )
+    
     @property
     def salario_mensual(self) -> float:
         """Getter del salario mensual"""
@@ -85,16 +108,14 @@ class EmpleadoAsalariado(Empleado):
         Returns:
             dict: Diccionario con todos los conceptos de pago
         """
-        salario_bruto = self.calcular_salario_bruto()
-        bono_antiguedad = self._calcular_bono_antiguedad()
-        deducciones = self.calcular_deducciones(salario_bruto)
+        nomina = self.calcular_nomina()
         
         return {
             'empleado': self.nombre,
             'tipo': 'Asalariado',
-            'salario_bruto': salario_bruto,
+            'salario_bruto': nomina.salario_bruto,
             'bono_alimentacion': self.BONO_ALIMENTACION,
-            'bono_antiguedad': bono_antiguedad,
-            'deducciones': deducciones,
-            'salario_neto': self.calcular_salario_neto()
+            'bono_antiguedad': nomina.conceptos['bono_antiguedad'],
+            'deducciones': nomina.deducciones,
+            'salario_neto': nomina.salario_neto
         }
\ No newline at end of file
@@ -4,6 +4,7 @@ Clase para empleados que cobran salario base más comisiones por ventas.
 
 from datetime import date
 from .empleado import Empleado
+from .resultado_nomina import ResultadoNomina
 
 
 class EmpleadoPorComision(Empleado):
@@ -16,10 +17,13 @@ class EmpleadoPorComision(Empleado):
     - Bono de alimentación de $1,000,000/mes
     """
     
+    __slots__ = ('_salario_base', '_porcentaje_comision', '_ventas_mes')
+    
     # Constantes
     BONO_ALIMENTACION = 1_000_000
     VENTAS_MINIMAS_BONO = 20_000_000
     PORCENTAJE_BONO_VENTAS = 0.03
+    NOMINA_SEGUN_FECHA = False
     
     def __init__(self, id_empleado: str, nombre: str, fecha_ingreso: date,
                  salario_base: float, porcentaje_comision: float, ventas_mes: float):
@@ -95,6 +99,26 @@ class EmpleadoPorComision(Empleado):
         bono_ventas = self._calcular_bono_ventas()
         return self.BONO_ALIMENTACION + bono_ventas
     
+    def _calcular_nomina(self, hoy: date) -> ResultadoNomina:
+        """
+        Calcula todos los conceptos de la nómina en una sola pasada.
+        
+        Args:
+            hoy (date): Fecha de referencia del cálculo
+            
+        Returns:
+            ResultadoNomina: Resultado de la nómina
+        """
+        comision = self._calcular_comision()
+        bono_ventas = self._calcular_bono_ventas()
+        
+        return self._liquidar(
+            self._salario_base + comision,
+            self.BONO_ALIMENTACION + bono_ventas,
+            comision=comision,
+            bono_ventas=bono_ventas
+        )
+    
     @property
     def salario_base(self) -> float:
         """Getter del salario base"""
@@ -124,6 +148,7 @@ class EmpleadoPorComision(Empleado):
         if ventas < 0:
             raise ValueError("Las ventas no pueden ser negativas")
         self._ventas_mes = ventas
+        self._invalidar_nomina()
     
     def obtener_detalle_nomina(self) -> dict:
         """
@@ -132,20 +157,17 @@ class EmpleadoPorComision(Empleado):
         Returns:
             dict: Diccionario con todos los conceptos de pago
         """
-        salario_bruto = self.calcular_salario_bruto()
-        comision = self._calcular_comision()
-        bono_ventas = self._calcular_bono_ventas()
-        deducciones = self.calcular_deducciones(salario_bruto)
+        nomina = self.calcular_nomina()
         
         return {
             'empleado': self.nombre,
             'tipo': 'Por Comisión',
             'salario_base': self._salario_base,
             'ventas': self._ventas_mes,
-            'comision': comision,
-            'salario_bruto': salario_bruto,
+            'comision': nomina.conceptos['comision'],
+            'salario_bruto': nomina.salario_bruto,
             'bono_alimentacion': self.BONO_ALIMENTACION,
-            'bono_ventas': bono_ventas,
-            'deducciones': deducciones,
-            'salario_neto': self.calcular_salario_neto()
+            'bono_ventas': nomina.conceptos['bono_ventas'],
+            'deducciones': nomina.deducciones,
+            'salario_neto': nomina.salario_neto
         }
\ No newline at end of file
@@ -4,6 +4,7 @@ Clase para empleados que cobran por horas trabajadas.
 
 from datetime import date
 from .empleado import Empleado
+from .resultado_nomina import ResultadoNomina
 
 
 class EmpleadoPorHoras(Empleado):
@@ -17,6 +18,8 @@ class EmpleadoPorHoras(Empleado):
     - Con más de 1 año: acceso a fondo de ahorro (2% del salario)
     """
     
+    __slots__ = ('_tarifa_por_hora', '_horas_trabajadas', '_acepta_fondo_ahorro')
+    
     # Constantes
     HORAS_NORMALES_LIMITE = 40
     MULTIPLICADOR_HORAS_EXTRAS = 1.5
@@ -80,25 +83,38 @@ class EmpleadoPorHoras(Empleado):
         Returns:
             float: Salario bruto total
         """
-        horas_normales = self._calcular_horas_normales()
-        horas_extras = self._calcular_horas_extras()
+        return self._calcular_pago(self._calcular_horas_normales(), self._calcular_horas_extras())
+    
+    def _calcular_pago(self, horas_normales: float, horas_extras: float) -> float:
+        """
+        Calcula el pago de horas normales + horas extras (1.5x).
         
+        Args:
+            horas_normales (float): Horas a tarifa normal
+            horas_extras (float): Horas extras
+            
+        Returns:
+            float: Salario bruto total
+        """
         pago_normal = horas_normales * self._tarifa_por_hora
         pago_extras = horas_extras * self._tarifa_por_hora * self.MULTIPLICADOR_HORAS_EXTRAS
         
         return pago_normal + pago_extras
     
-    def _calcular_fondo_ahorro(self) -> float:
+    def _calcular_fondo_ahorro(self, salario_bruto: float, hoy: date | None = None) -> float:
         """
         Calcula el aporte al fondo de ahorro.
-        Solo aplica si tiene más de 1 año y aceptó el fondo.
+        Solo aplica si aceptó el fondo y tiene más de 1 año.
+        
+        Args:
+            salario_bruto (float): Salario bruto ya calculado
+            hoy (date, opcional): Fecha de referencia para la antigüedad
         
         Returns:
             float: Monto del fondo de ahorro (beneficio)
         """
-        if (self.obtener_antiguedad_años() > self.AÑOS_MINIMOS_FONDO 
-            and self._acepta_fondo_ahorro):
-            salario_bruto = self.calcular_salario_bruto()
+        if (self._acepta_fondo_ahorro
+            and self.obtener_antiguedad_años(hoy) > self.AÑOS_MINIMOS_FONDO):
             return salario_bruto * self.PORCENTAJE_FONDO_AHORRO
         return 0
     
@@ -110,13 +126,39 @@ class EmpleadoPorHoras(Empleado):
         Returns:
             float: Total de beneficios
         """
-        return self._calcular_fondo_ahorro()
+        return self._calcular_fondo_ahorro(self.calcular_salario_bruto())
+    
+    def _calcular_nomina(self, hoy: date) -> ResultadoNomina:
+        """
+        Calcula todos los conceptos de la nómina en una sola pasada.
+        
+        Args:
+            hoy (date): Fecha de referencia del cálculo
+            
+        Returns:
+            ResultadoNomina: Resultado de la nómina
+        """
+        horas_normales = self._calcular_horas_normales()
+        horas_extras = self._calcular_horas_extras()
+        salario_bruto = self._calcular_pago(horas_normales, horas_extras)
+        
+        return self._liquidar(
+            salario_bruto,
+            self._calcular_fondo_ahorro(salario_bruto, hoy),
+            horas_normales=horas_normales,
+            horas_extras=horas_extras
+        )
     
     @property
     def tarifa_por_hora(self) -> float:
         """Getter de la tarifa por hora"""
         return self._tarifa_por_hora
     
+    @property
+    def acepta_fondo_ahorro(self) -> bool:
+        """Getter de la aceptación del fondo de ahorro"""
+        return self._acepta_fondo_ahorro
+    
     @property
     def horas_trabajadas(self) -> float:
         """Getter de horas trabajadas"""
@@ -136,6 +178,7 @@ class EmpleadoPorHoras(Empleado):
         if horas < 0:
             raise ValueError("Las horas trabajadas no pueden ser negativas")
         self._horas_trabajadas = horas
+        self._invalidar_nomina()
     
     def obtener_detalle_nomina(self) -> dict:
         """
@@ -144,17 +187,15 @@ class EmpleadoPorHoras(Empleado):
         Returns:
             dict: Diccionario con todos los conceptos de pago
         """
-        salario_bruto = self.calcular_salario_bruto()
-        fondo_ahorro = self._calcular_fondo_ahorro()
-        deducciones = self.calcular_deducciones(salario_bruto)
+        nomina = self.calcular_nomina()
         
         return {
             'empleado': self.nombre,
             'tipo': 'Por Horas',
-            'horas_normales': self._calcular_horas_normales(),
-            'horas_extras': self._calcular_horas_extras(),
-            'salario_bruto': salario_bruto,
-            'fondo_ahorro': fondo_ahorro,
-            'deducciones': deducciones,
-            'salario_neto': self.calcular_salario_neto()
+            'horas_normales': nomina.conceptos['horas_normales'],
+            'horas_extras': nomina.conceptos['horas_extras'],
+            'salario_bruto': nomina.salario_bruto,
+            'fondo_ahorro': nomina.beneficios,
+            'deducciones': nomina.deducciones,
+            'salario_neto': nomina.salario_neto
         }
\ No newline at end of file
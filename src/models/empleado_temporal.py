@@ -16,6 +16,11 @@ class EmpleadoTemporal(Empleado):
     - No aplican bonos ni beneficios adicionales
     """
     
+    __slots__ = ('_salario_mensual', '_fecha_fin_contrato', '_fin_contrato_ordinal')
+    
+    # Constantes
+    NOMINA_SEGUN_FECHA = False
+    
     def __init__(self, id_empleado: str, nombre: str, fecha_ingreso: date,
                  salario_mensual: float, fecha_fin_contrato: date):
         """
@@ -41,6 +46,7 @@ class EmpleadoTemporal(Empleado):
         
         self._salario_mensual = salario_mensual
         self._fecha_fin_contrato = fecha_fin_contrato
+        self._fin_contrato_ordinal = fecha_fin_contrato.toordinal()
     
     def calcular_salario_bruto(self) -> float:
         """
@@ -61,24 +67,32 @@ class EmpleadoTemporal(Empleado):
         """
         return 0
     
-    def contrato_vigente(self) -> bool:
+    def contrato_vigente(self, hoy: date | None = None) -> bool:
         """
         Verifica si el contrato del empleado está vigente.
         
+        Args:
+            hoy (date, opcional): Fecha de referencia (por defecto, la fecha actual)
+        
         Returns:
             bool: True si el contrato está vigente, False si ya venció
         """
-        return date.today() <= self._fecha_fin_contrato
+        return self.dias_restantes_contrato(hoy) >= 0
     
-    def dias_restantes_contrato(self) -> int:
+    def dias_restantes_contrato(self, hoy: date | None = None) -> int:
         """
         Calcula los días restantes del contrato.
+        Resta los ordinales de las fechas, sin crear un timedelta.
+        
+        Args:
+            hoy (date, opcional): Fecha de referencia (por defecto, la fecha actual)
         
         Returns:
             int: Días restantes (puede ser negativo si el contrato venció)
         """
-        diferencia = self._fecha_fin_contrato - date.today()
-        return diferencia.days
+        if hoy is None:
+            hoy = date.today()
+        return self._fin_contrato_ordinal - hoy.toordinal()
     
     @property
     def salario_mensual(self) -> float:
@@ -97,16 +111,15 @@ class EmpleadoTemporal(Empleado):
         Returns:
             dict: Diccionario con todos los conceptos de pago
         """
-        salario_bruto = self.calcular_salario_bruto()
-        deducciones = self.calcular_deducciones(salario_bruto)
+        nomina = self.calcular_nomina()
         
         return {
             'empleado': self.nombre,
             'tipo': 'Temporal',
-            'salario_bruto': salario_bruto,
-            'beneficios': 0,
-            'deducciones': deducciones,
-            'salario_neto': self.calcular_salario_neto(),
+            'salario_bruto': nomina.salario_bruto,
+            'beneficios': nomina.beneficios,
+            'deducciones': nomina.deducciones,
+            'salario_neto': nomina.salario_neto,
             'fecha_fin_contrato': self._fecha_fin_contrato.strftime('%Y-%m-%d'),
             'contrato_vigente': self.contrato_vigente(),
             'dias_restantes': self.dias_restantes_contrato()
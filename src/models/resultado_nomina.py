@@ -0,0 +1,24 @@
+"""
+Resultado del cálculo de la nómina de un empleado.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, slots=True)
+class ResultadoNomina:
+    """
+    Conceptos de pago de un empleado, calculados en una sola pasada.
+
+    Attributes:
+        salario_bruto (float): Salario bruto
+        beneficios (float): Total de beneficios
+        deducciones (float): Total de deducciones
+        salario_neto (float): Salario neto (nunca negativo)
+        conceptos (dict): Conceptos propios de cada tipo de empleado
+    """
+    salario_bruto: float
+    beneficios: float
+    deducciones: float
+    salario_neto: float
+    conceptos: dict = field(default_factory=dict)
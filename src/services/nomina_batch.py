@@ -0,0 +1,459 @@
+"""
+Cálculo de la nómina por lotes.
+Convierte una lista de empleados en una TablaNomina: una columna de NumPy
+por atributo y una columna "tipo" que etiqueta cada fila. Los salarios
+netos se calculan filtrando las filas de cada tipo y aplicando su kernel
+por lote, sin una llamada a calcular_salario_neto() por empleado.
+
+Si Numba está instalado se usan los kernels compilados y paralelos de
+src.models._kernels (la primera ejecución paga la compilación JIT; las
+siguientes la cargan del caché en disco). Si no, se usan las expresiones
+vectorizadas de NumPy de este módulo, que producen el mismo resultado.
+"""
+
+from datetime import date
+from operator import attrgetter, methodcaller
+
+import numpy as np
+
+from ..models import _coeficientes
+from ..models.empleado import Empleado
+from ..models.empleado_asalariado import EmpleadoAsalariado
+from ..models.empleado_por_horas import EmpleadoPorHoras
+from ..models.empleado_por_comision import EmpleadoPorComision
+from ..models.empleado_temporal import EmpleadoTemporal
+
+try:
+    from ..models import _kernels
+except ImportError:  # Numba no disponible: se usan los kernels de NumPy
+    _kernels = None
+
+
+# Etiquetas de tipo de cada fila de la tabla
+TIPO_OTRO = -1
+TIPO_ASALARIADO = 0
+TIPO_POR_HORAS = 1
+TIPO_POR_COMISION = 2
+TIPO_TEMPORAL = 3
+
+
+def _agrupar_filas(empleados: list) -> dict:
+    """
+    Agrupa las posiciones de los empleados según su clase.
+
+    Args:
+        empleados (list): Empleados de cualquier tipo
+
+    Returns:
+        dict: Diccionario {clase: lista de posiciones}
+    """
+    filas = {}
+    for i, empleado in enumerate(empleados):
+        filas.setdefault(type(empleado), []).append(i)
+    return filas
+
+
+def _columna(valores, cantidad: int, dtype=np.float64) -> np.ndarray:
+    """Construye un arreglo de NumPy a partir de un iterable de valores"""
+    return np.fromiter(valores, dtype=dtype, count=cantidad)
+
+
+# =============================================================================
+# Extracción de columnas por tipo de empleado
+# Cada grupo contiene solo instancias exactas de su clase, así que se leen
+# los atributos de __slots__ con attrgetter y map: el recorrido se hace en C,
+# sin un generador ni una llamada a la propiedad por empleado.
+# =============================================================================
+
+def _columnas_asalariados(grupo: list, hoy: date) -> tuple:
+    """Columnas (salario, antigüedad) de un grupo de empleados asalariados"""
+    n = len(grupo)
+    return (
+        _columna(map(attrgetter('_salario_mensual'), grupo), n),
+        _columna(map(methodcaller('obtener_antiguedad_años', hoy), grupo), n, np.int32),
+    )
+
+
+def _columnas_por_horas(grupo: list, hoy: date) -> tuple:
+    """Columnas (tarifa, horas, antigüedad, acepta fondo) de empleados por horas"""
+    n = len(grupo)
+    return (
+        _columna(map(attrgetter('_tarifa_por_hora'), grupo), n),
+        _columna(map(attrgetter('_horas_trabajadas'), grupo), n),
+        _columna(map(methodcaller('obtener_antiguedad_años', hoy), grupo), n, np.int32),
+        _columna(map(attrgetter('_acepta_fondo_ahorro'), grupo), n, np.bool_),
+    )
+
+
+def _columnas_por_comision(grupo: list, hoy: date) -> tuple:
+    """Columnas (salario base, % comisión, ventas) de empleados por comisión"""
+    n = len(grupo)
+    return (
+        _columna(map(attrgetter('_salario_base'), grupo), n),
+        _columna(map(attrgetter('_porcentaje_comision'), grupo), n),
+        _columna(map(attrgetter('_ventas_mes'), grupo), n),
+    )
+
+
+def _columnas_temporales(grupo: list, hoy: date) -> tuple:
+    """Columna (salario,) de un grupo de empleados temporales"""
+    return (_columna(map(attrgetter('_salario_mensual'), grupo), len(grupo)),)
+
+
+# =============================================================================
+# Conceptos (salario bruto, beneficios y su desglose) por lote con NumPy
+# Las reglas condicionales multiplican por la máscara booleana en lugar de
+# usar np.where, igual que los kernels de Numba.
+# =============================================================================
+
+def _conceptos_asalariado(salario, antiguedad) -> tuple:
+    """Salario bruto, beneficios y desglose de un lote de empleados asalariados"""
+    bono_antiguedad = (salario * EmpleadoAsalariado.PORCENTAJE_BONO_ANTIGUEDAD
+                       * (antiguedad > EmpleadoAsalariado.AÑOS_MINIMOS_BONO))
+    return salario, EmpleadoAsalariado.BONO_ALIMENTACION + bono_antiguedad, {
+        'bono_alimentacion': EmpleadoAsalariado.BONO_ALIMENTACION,
+        'bono_antiguedad': bono_antiguedad,
+    }
+
+
+def _conceptos_por_horas(tarifa, horas, antiguedad, acepta_fondo) -> tuple:
+    """Salario bruto, fondo de ahorro y desglose de un lote de empleados por horas"""
+    limite = EmpleadoPorHoras.HORAS_NORMALES_LIMITE
+    horas_normales = np.minimum(horas, limite)
+    horas_extras = np.maximum(horas - limite, 0.0)
+    salario_bruto = (horas_normales * tarifa
+                     + horas_extras * tarifa * EmpleadoPorHoras.MULTIPLICADOR_HORAS_EXTRAS)
+
+    califica_fondo = (antiguedad > EmpleadoPorHoras.AÑOS_MINIMOS_FONDO) & acepta_fondo
+    fondo_ahorro = salario_bruto * EmpleadoPorHoras.PORCENTAJE_FONDO_AHORRO * califica_fondo
+    return salario_bruto, fondo_ahorro, {
+        'horas_normales': horas_normales,
+        'horas_extras': horas_extras,
+        'fondo_ahorro': fondo_ahorro,
+    }
+
+
+def _conceptos_por_comision(salario_base, porcentaje_comision, ventas) -> tuple:
+    """Salario bruto, beneficios y desglose de un lote de empleados por comisión"""
+    comision = ventas * porcentaje_comision
+    bono_ventas = (ventas * EmpleadoPorComision.PORCENTAJE_BONO_VENTAS
+                   * (ventas > EmpleadoPorComision.VENTAS_MINIMAS_BONO))
+    return salario_base + comision, EmpleadoPorComision.BONO_ALIMENTACION + bono_ventas, {
+        'comision': comision,
+        'bono_alimentacion': EmpleadoPorComision.BONO_ALIMENTACION,
+        'bono_ventas': bono_ventas,
+    }
+
+
+def _conceptos_temporal(salario) -> tuple:
+    """Salario bruto y beneficios (ninguno) de un lote de empleados temporales"""
+    return salario, np.zeros_like(salario), {}
+
+
+# =============================================================================
+# Kernels por lote con NumPy
+# Para asalariados y por horas la condición de bono o fondo solo elige el
+# factor precalculado de la cohorte.
+# =============================================================================
+
+def _calcular_netos(salario_bruto: np.ndarray, beneficios: np.ndarray,
+                    porcentaje_deducciones: float, netos: np.ndarray):
+    """
+    Aplica las deducciones obligatorias y escribe los salarios netos.
+
+    Args:
+        salario_bruto (np.ndarray): Salarios brutos del grupo
+        beneficios (np.ndarray): Beneficios del grupo
+        porcentaje_deducciones (float): Fracción del salario bruto deducida
+        netos (np.ndarray): Arreglo de salida para los salarios netos
+    """
+    deducciones = salario_bruto * porcentaje_deducciones
+    np.subtract(salario_bruto + beneficios, deducciones, out=netos)
+    np.maximum(netos, 0.0, out=netos)
+
+
+def _lote_neto_asalariado(reglas, salario, antiguedad, netos):
+    """Salarios netos de un lote de empleados asalariados (reglas_asalariado())"""
+    cohorte = (antiguedad > reglas[0]).astype(np.intp)
+    factor = np.take(reglas, 1 + cohorte)
+    np.multiply(salario, factor, out=netos)
+    netos += reglas[3]
+    np.maximum(netos, 0.0, out=netos)
+
+
+def _lote_neto_por_horas(reglas, tarifa, horas, antiguedad, acepta_fondo, netos):
+    """Salarios netos de un lote de empleados por horas (reglas_por_horas())"""
+    horas_normales = np.minimum(horas, reglas[0])
+    horas_extras = np.maximum(horas - reglas[0], 0.0)
+    salario_bruto = horas_normales * tarifa + horas_extras * tarifa * reglas[1]
+
+    cohorte = ((antiguedad > reglas[2]) & acepta_fondo).astype(np.intp)
+    factor = np.take(reglas, 3 + cohorte)
+    np.multiply(salario_bruto, factor, out=netos)
+    np.maximum(netos, 0.0, out=netos)
+
+
+def _lote_neto_por_comision(reglas, salario_base, porcentaje_comision, ventas, netos):
+    """Salarios netos de un lote de empleados por comisión (reglas_por_comision())"""
+    salario_bruto = salario_base + ventas * porcentaje_comision
+    bono_ventas = ventas * reglas[3] * (ventas > reglas[2])
+    _calcular_netos(salario_bruto, reglas[1] + bono_ventas, reglas[0], netos)
+
+
+def _lote_neto_temporal(reglas, salario, netos):
+    """Salarios netos de un lote de empleados temporales, sin beneficios (reglas_temporal())"""
+    _calcular_netos(salario, 0.0, reglas[0], netos)
+
+
+# Etiqueta, extracción de columnas y nombres de columna de cada clase
+_TIPOS = {
+    EmpleadoAsalariado: (TIPO_ASALARIADO, _columnas_asalariados,
+                         ('salario', 'antiguedad')),
+    EmpleadoPorHoras: (TIPO_POR_HORAS, _columnas_por_horas,
+                       ('tarifa', 'horas', 'antiguedad', 'acepta_fondo')),
+    EmpleadoPorComision: (TIPO_POR_COMISION, _columnas_por_comision,
+                          ('salario', 'porcentaje_comision', 'ventas')),
+    EmpleadoTemporal: (TIPO_TEMPORAL, _columnas_temporales, ('salario',)),
+}
+
+# Kernel por lote de cada etiqueta de tipo
+if _kernels is not None:
+    _KERNELS = {
+        TIPO_ASALARIADO: _kernels.lote_neto_asalariado,
+        TIPO_POR_HORAS: _kernels.lote_neto_por_horas,
+        TIPO_POR_COMISION: _kernels.lote_neto_por_comision,
+        TIPO_TEMPORAL: _kernels.lote_neto_temporal,
+    }
+else:
+    _KERNELS = {
+        TIPO_ASALARIADO: _lote_neto_asalariado,
+        TIPO_POR_HORAS: _lote_neto_por_horas,
+        TIPO_POR_COMISION: _lote_neto_por_comision,
+        TIPO_TEMPORAL: _lote_neto_temporal,
+    }
+
+# Reglas que recibe el kernel de cada etiqueta de tipo; se arman en cada
+# cálculo para que sigan siempre las constantes vigentes de las clases
+_REGLAS = {
+    TIPO_ASALARIADO: _coeficientes.reglas_asalariado,
+    TIPO_POR_HORAS: _coeficientes.reglas_por_horas,
+    TIPO_POR_COMISION: _coeficientes.reglas_por_comision,
+    TIPO_TEMPORAL: _coeficientes.reglas_temporal,
+}
+
+# Columnas que recibe el kernel de cada etiqueta de tipo, en orden
+_COLUMNAS_KERNEL = {tipo: nombres for tipo, _, nombres in _TIPOS.values()}
+
+# Columnas del desglose de conceptos en TablaNomina.detalle(); cada tipo
+# llena solo las que aplican (las claves de obtener_detalle_nomina)
+_COLUMNAS_CONCEPTOS = ('horas_normales', 'horas_extras', 'comision', 'bono_alimentacion',
+                       'bono_antiguedad', 'bono_ventas', 'fondo_ahorro')
+
+# Conceptos y nombre (como en obtener_detalle_nomina) de cada etiqueta de tipo
+_CONCEPTOS = {
+    TIPO_ASALARIADO: (_conceptos_asalariado, 'Asalariado'),
+    TIPO_POR_HORAS: (_conceptos_por_horas, 'Por Horas'),
+    TIPO_POR_COMISION: (_conceptos_por_comision, 'Por Comisión'),
+    TIPO_TEMPORAL: (_conceptos_temporal, 'Temporal'),
+}
+
+
+class TablaNomina:
+    """
+    Nómina en formato de columnas: un arreglo por atributo, una fila por
+    empleado y una etiqueta de tipo que indica qué columnas usa cada fila.
+
+    Columnas:
+        tipo: Etiqueta TIPO_* del empleado
+        salario: Salario mensual (asalariado, temporal) o salario base (comisión)
+        tarifa, horas: Tarifa por hora y horas trabajadas (por horas)
+        ventas, porcentaje_comision: Ventas del mes y % de comisión (comisión)
+        antiguedad: Años de antigüedad a la fecha de referencia
+        acepta_fondo: Si acepta el fondo de ahorro (por horas)
+
+    Las filas TIPO_OTRO (clases sin kernel por lote) guardan en la columna
+    salario el neto ya calculado con calcular_salario_neto().
+
+    Las columnas de dinero son float64: float32 solo representa enteros
+    exactos hasta 2^24 (~16,7 millones) y las ventas y salarios los superan.
+    Las columnas que no son dinero usan el tipo más angosto que basta
+    (int8 para el tipo, int32 para la antigüedad, bool para el fondo).
+    """
+
+    def __init__(self, cantidad: int):
+        """
+        Crea una tabla vacía.
+
+        Args:
+            cantidad (int): Número de filas (empleados)
+        """
+        self.tipo = np.full(cantidad, TIPO_OTRO, dtype=np.int8)
+        self.nombre = np.empty(cantidad, dtype=object)
+        self.salario = np.zeros(cantidad, dtype=np.float64)
+        self.tarifa = np.zeros(cantidad, dtype=np.float64)
+        self.horas = np.zeros(cantidad, dtype=np.float64)
+        self.ventas = np.zeros(cantidad, dtype=np.float64)
+        self.porcentaje_comision = np.zeros(cantidad, dtype=np.float64)
+        self.antiguedad = np.zeros(cantidad, dtype=np.int32)
+        self.acepta_fondo = np.zeros(cantidad, dtype=np.bool_)
+
+    @classmethod
+    def desde_empleados(cls, empleados, hoy: date | None = None) -> 'TablaNomina':
+        """
+        Convierte una lista de empleados en una tabla de columnas.
+        Cada empleado se lee una sola vez.
+
+        Las filas de clases sin kernel por lote (TIPO_OTRO) guardan el
+        resultado de calcular_salario_neto(), que siempre usa la fecha
+        actual: para esas filas no se aplica hoy. Se usa el método público
+        porque la subclase puede haber redefinido cualquier parte del cálculo.
+
+        Args:
+            empleados: Iterable de empleados de cualquier tipo
+            hoy (date, opcional): Fecha de referencia (por defecto, la fecha actual)
+
+        Returns:
+            TablaNomina: Tabla con una fila por empleado, en el mismo orden
+        """
+        if hoy is None:
+            hoy = date.today()
+
+        empleados = list(empleados)
+        tabla = cls(len(empleados))
+
+        for clase, filas in _agrupar_filas(empleados).items():
+            grupo = [empleados[i] for i in filas]
+            tabla.nombre[filas] = [e.nombre for e in grupo]
+
+            if clase not in _TIPOS:
+                # Calculado a la fecha actual, no a hoy (ver docstring)
+                tabla.salario[filas] = [e.calcular_salario_neto() for e in grupo]
+                continue
+
+            tipo, extraer_columnas, nombres = _TIPOS[clase]
+            tabla.tipo[filas] = tipo
+            for nombre, valores in zip(nombres, extraer_columnas(grupo, hoy)):
+                getattr(tabla, nombre)[filas] = valores
+
+        return tabla
+
+    def __len__(self) -> int:
+        """Número de filas (empleados) de la tabla"""
+        return len(self.tipo)
+
+    def _netos_por_tipo(self):
+        """
+        Calcula los salarios netos agrupados por etiqueta de tipo.
+        Las filas de cada tipo se procesan juntas con su kernel por lote.
+
+        Yields:
+            tuple: (posiciones de las filas, salarios netos de esas filas)
+        """
+        for tipo, kernel in _KERNELS.items():
+            filas = np.flatnonzero(self.tipo == tipo)
+            if filas.size == 0:
+                continue
+
+            salida = np.empty(filas.size, dtype=np.float64)
+            columnas = (getattr(self, nombre)[filas] for nombre in _COLUMNAS_KERNEL[tipo])
+            kernel(_REGLAS[tipo](), *columnas, salida)
+            yield filas, salida
+
+        otros = np.flatnonzero(self.tipo == TIPO_OTRO)
+        yield otros, self.salario[otros]
+
+    def netos(self) -> np.ndarray:
+        """
+        Calcula los salarios netos de todas las filas.
+
+        Returns:
+            np.ndarray: Salarios netos, en el orden de las filas
+        """
+        netos = np.empty(len(self), dtype=np.float64)
+        for filas, salida in self._netos_por_tipo():
+            netos[filas] = salida
+        return netos
+
+    def detalle(self) -> np.ndarray:
+        """
+        Genera el detalle de la nómina de todas las filas en un solo arreglo
+        estructurado, sin un diccionario por empleado. Puede convertirse en
+        tabla de pandas con pandas.DataFrame(tabla.detalle()).
+
+        Cada fila desglosa los conceptos de su tipo (horas, comisión, bonos,
+        fondo de ahorro); los que no aplican quedan en NaN. El salario neto
+        se obtiene de las columnas ya calculadas, sin volver a ejecutar los
+        kernels, así que siempre cumple
+            salario_neto = max(0, salario_bruto + beneficios - deducciones)
+
+        Las filas TIPO_OTRO solo tienen salario neto; sus demás conceptos
+        quedan en NaN.
+
+        Returns:
+            np.ndarray: Arreglo con los campos empleado, tipo, salario_bruto,
+            los conceptos de _COLUMNAS_CONCEPTOS, beneficios, deducciones y
+            salario_neto
+        """
+        nombres = self.nombre.astype(str)
+        detalle = np.empty(len(self), dtype=[
+            ('empleado', nombres.dtype),
+            ('tipo', 'U12'),
+            ('salario_bruto', np.float64),
+            *((nombre, np.float64) for nombre in _COLUMNAS_CONCEPTOS),
+            ('beneficios', np.float64),
+            ('deducciones', np.float64),
+            ('salario_neto', np.float64),
+        ])
+        detalle['empleado'] = nombres
+        detalle['tipo'] = 'Otro'
+        for nombre in ('salario_bruto', *_COLUMNAS_CONCEPTOS, 'beneficios'):
+            detalle[nombre] = np.nan
+
+        for tipo, (conceptos, nombre_tipo) in _CONCEPTOS.items():
+            filas = np.flatnonzero(self.tipo == tipo)
+            if filas.size == 0:
+                continue
+
+            columnas = (getattr(self, nombre)[filas] for nombre in _COLUMNAS_KERNEL[tipo])
+            salario_bruto, beneficios, desglose = conceptos(*columnas)
+            detalle['tipo'][filas] = nombre_tipo
+            detalle['salario_bruto'][filas] = salario_bruto
+            detalle['beneficios'][filas] = beneficios
+            for nombre, valores in desglose.items():
+                detalle[nombre][filas] = valores
+
+        detalle['deducciones'] = detalle['salario_bruto'] * Empleado.PORCENTAJE_DEDUCCIONES
+        detalle['salario_neto'] = np.maximum(
+            detalle['salario_bruto'] + detalle['beneficios'] - detalle['deducciones'], 0.0)
+
+        otros = np.flatnonzero(self.tipo == TIPO_OTRO)
+        detalle['salario_neto'][otros] = self.salario[otros]
+        return detalle
+
+    def total_neto(self) -> float:
+        """
+        Calcula el total de la nómina de la tabla.
+        Suma directamente la salida de cada kernel por lote, sin armar el
+        arreglo completo de salarios netos.
+
+        Returns:
+            float: Suma de los salarios netos
+        """
+        return float(sum(salida.sum() for _, salida in self._netos_por_tipo()))
+
+
+def calcular_total_nomina(empleados, hoy: date | None = None) -> float:
+    """
+    Calcula el total de la nómina mensual de una lista de empleados.
+    La fecha de referencia se obtiene una sola vez para toda la nómina.
+    Los empleados de clases sin kernel por lote se calculan a la fecha
+    actual (ver TablaNomina.desde_empleados).
+
+    Args:
+        empleados: Iterable de empleados de cualquier tipo
+        hoy (date, opcional): Fecha de referencia (por defecto, la fecha actual)
+
+    Returns:
+        float: Suma de los salarios netos
+    """
+    return TablaNomina.desde_empleados(empleados, hoy).total_neto()
@@ -0,0 +1,50 @@
+"""
+Configuración compartida de las pruebas.
+Congela la fecha actual para que la antigüedad y la vigencia de los
+contratos no dependan del día en que se ejecuta la suite.
+"""
+
+import pytest
+from datetime import date
+
+
+# Fecha que devuelve date.today() durante las pruebas
+HOY = date(2025, 1, 1)
+
+# Módulos de modelos que consultan date.today()
+MODULOS_CON_FECHA = (
+    "src.models.empleado",
+    "src.models.empleado_temporal",
+)
+
+
+class FrozenDate(date):
+    """date cuya fecha actual es siempre HOY"""
+
+    @classmethod
+    def today(cls):
+        return HOY
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _congelar_hoy():
+    """
+    Reemplaza date en los módulos de modelos durante toda la sesión.
+    Con pytest-xdist cada proceso ejecuta su propia sesión y aplica el
+    reemplazo por separado.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for modulo in MODULOS_CON_FECHA:
+            mp.setattr(f"{modulo}.date", FrozenDate)
+        yield
+
+
+@pytest.fixture(scope="session")
+def congelar_hoy_lotes():
+    """
+    Reemplaza date en el servicio de nómina por lotes.
+    Es aparte para que solo las pruebas que lo piden importen NumPy y Numba.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.services.nomina_batch.date", FrozenDate)
+        yield
@@ -5,200 +5,301 @@ Implementa pruebas para todos los tipos de empleados y sus reglas de negocio.
 
 import pytest
 from datetime import date
+from hypothesis import given, settings, strategies as st
+from src.models.empleado import Empleado
 from src.models.empleado_asalariado import EmpleadoAsalariado
 from src.models.empleado_por_horas import EmpleadoPorHoras
 from src.models.empleado_por_comision import EmpleadoPorComision
 from src.models.empleado_temporal import EmpleadoTemporal
 
 
+# Fechas compartidas por las pruebas (date es inmutable)
+FECHA_INGRESO_2018 = date(2018, 1, 1)
+FECHA_INGRESO_2020 = date(2020, 1, 1)
+FECHA_INGRESO_2022 = date(2022, 1, 1)
+FECHA_INGRESO_2024 = date(2024, 1, 1)
+FECHA_FIN_2025 = date(2025, 12, 31)
+FECHA_FIN_2023_INVALIDA = date(2023, 12, 31)
+FECHA_FUTURA_2030 = date(2030, 1, 1)
+
+# Parámetros de negocio con los que se calculan los valores esperados
+BONO_ALIM = 1_000_000
+TASA_ANT = 0.10
+FONDO_AHORRO_PCT = 0.02
+HORAS_STD = 40
+MULT_EXT = 1.5
+COMISION_BONO_UMBRAL = 20_000_000
+COMISION_BONO_PCT = 0.03
+DEDUCCION_PCT = 0.04
+
+# Entradas que el constructor debe rechazar con ValueError: (clase, argumentos)
+CASOS_INVALIDOS = [
+    pytest.param(EmpleadoAsalariado, ("001", "Juan Pérez", FECHA_INGRESO_2020, -1000),
+                 id="salario_invalido"),
+    pytest.param(EmpleadoPorHoras, ("002", "María García", FECHA_INGRESO_2022, 50_000, -10),
+                 id="horas_negativas"),
+    pytest.param(EmpleadoPorComision, ("003", "Carlos López", FECHA_INGRESO_2020,
+                                       2_000_000, 0.05, -1000),
+                 id="ventas_negativas"),
+    pytest.param(EmpleadoTemporal, ("004", "Ana Ruiz", FECHA_INGRESO_2024,
+                                    3_000_000, FECHA_FIN_2023_INVALIDA),
+                 id="fecha_fin_invalida"),
+    pytest.param(EmpleadoAsalariado, ("001", "Juan Pérez", FECHA_FUTURA_2030, 5_000_000),
+                 id="fecha_ingreso_futura"),
+    pytest.param(EmpleadoAsalariado, ("001", "", FECHA_INGRESO_2020, 5_000_000),
+                 id="nombre_vacio"),
+    pytest.param(EmpleadoAsalariado, ("", "Juan Pérez", FECHA_INGRESO_2020, 5_000_000),
+                 id="id_vacio"),
+]
+
+
+# Empleados compartidos por las pruebas que no modifican su estado.
+# Las pruebas que usan un setter crean su propia instancia.
+@pytest.fixture(scope="module")
+def emp_asalariado_2020():
+    """Empleado asalariado con ingreso en 2020 y salario de 5M"""
+    return EmpleadoAsalariado("001", "Juan Pérez", FECHA_INGRESO_2020, 5_000_000)
+
+
+@pytest.fixture(scope="module")
+def emp_horas_2022():
+    """Empleado por horas con ingreso en 2022, tarifa de 50K y 40 horas"""
+    return EmpleadoPorHoras("002", "María García", FECHA_INGRESO_2022, 50_000, 40)
+
+
+@pytest.fixture(scope="module")
+def emp_comision_low():
+    """Empleado por comisión con ventas bajas (15M, sin bono por ventas)"""
+    return EmpleadoPorComision("003", "Carlos López", FECHA_INGRESO_2020,
+                               2_000_000, 0.05, 15_000_000)
+
+
+@pytest.fixture(scope="module")
+def emp_temporal():
+    """Empleado temporal con contrato hasta el 31 de diciembre de 2025"""
+    return EmpleadoTemporal("004", "Ana Ruiz", FECHA_INGRESO_2024,
+                            3_000_000, FECHA_FIN_2025)
+
+
 class TestEmpleadoAsalariado:
     """Pruebas para EmpleadoAsalariado"""
     
-    def test_creacion_empleado_asalariado(self):
+    def test_creacion_empleado_asalariado(self, emp_asalariado_2020):
         """Verifica que se puede crear un empleado asalariado correctamente"""
-        emp = EmpleadoAsalariado("001", "Juan Pérez", date(2020, 1, 1), 5_000_000)
-        assert emp.nombre == "Juan Pérez"
-        assert emp.salario_mensual == 5_000_000
+        assert emp_asalariado_2020.nombre == "Juan Pérez"
+        assert emp_asalariado_2020.salario_mensual == 5_000_000
     
-    def test_salario_bruto_asalariado(self):
+    def test_salario_bruto_asalariado(self, emp_asalariado_2020):
         """Verifica el cálculo del salario bruto"""
-        emp = EmpleadoAsalariado("001", "Juan Pérez", date(2020, 1, 1), 5_000_000)
-        assert emp.calcular_salario_bruto() == 5_000_000
-    
-    def test_bono_antiguedad_mas_5_años(self):
-        """Verifica que se otorga bono por antigüedad si tiene más de 5 años"""
-        emp = EmpleadoAsalariado("001", "Juan Pérez", date(2018, 1, 1), 5_000_000)
-        beneficios = emp.calcular_beneficios()
-        # Bono alimentación (1M) + bono antigüedad (10% de 5M = 500K) = 1.5M
-        assert beneficios == 1_500_000
-    
-    def test_sin_bono_antiguedad_menos_5_años(self):
-        """Verifica que NO se otorga bono por antigüedad si tiene menos de 5 años"""
-        emp = EmpleadoAsalariado("001", "Juan Pérez", date(2022, 1, 1), 5_000_000)
-        beneficios = emp.calcular_beneficios()
-        # Solo bono alimentación (1M)
-        assert beneficios == 1_000_000
-    
-    def test_deducciones_asalariado(self):
+        assert emp_asalariado_2020.calcular_salario_bruto() == 5_000_000
+    
+    @pytest.mark.parametrize("fecha_ingreso,esperado", [
+        # Más de 5 años: bono alimentación + bono antigüedad (10% de 5M)
+        (FECHA_INGRESO_2018, BONO_ALIM + TASA_ANT * 5_000_000),
+        # Menos de 5 años: solo bono alimentación
+        (FECHA_INGRESO_2022, BONO_ALIM),
+    ])
+    def test_bono_antiguedad(self, fecha_ingreso, esperado):
+        """Verifica que el bono por antigüedad solo se otorga con más de 5 años"""
+        emp = EmpleadoAsalariado("001", "Juan Pérez", fecha_ingreso, 5_000_000)
+        assert emp.calcular_beneficios() == esperado
+    
+    def test_antiguedad_fecha_referencia(self):
+        """Verifica la antigüedad respecto a una fecha de referencia dada"""
+        emp = EmpleadoAsalariado("001", "Juan Pérez", date(2018, 6, 15), 5_000_000)
+        assert emp.obtener_antiguedad_años(date(2024, 6, 14)) == 5
+        assert emp.obtener_antiguedad_años(date(2024, 6, 15)) == 6
+    
+    def test_subclase_redefine_salario_bruto(self):
+        """Verifica que el salario neto usa el salario bruto redefinido por una subclase"""
+        class EmpleadoConPrima(EmpleadoAsalariado):
+            __slots__ = ()
+            
+            def calcular_salario_bruto(self) -> float:
+                return super().calcular_salario_bruto() + 1_000_000
+        
+        emp = EmpleadoConPrima("001", "Juan Pérez", FECHA_INGRESO_2022, 5_000_000)
+        assert emp.calcular_salario_neto() == pytest.approx(
+            6_000_000 * (1 - DEDUCCION_PCT) + BONO_ALIM)
+    
+    def test_deducciones_asalariado(self, emp_asalariado_2020):
         """Verifica el cálculo de deducciones (4% del salario bruto)"""
-        emp = EmpleadoAsalariado("001", "Juan Pérez", date(2020, 1, 1), 5_000_000)
-        deducciones = emp.calcular_deducciones(5_000_000)
-        assert deducciones == 200_000  # 4% de 5M
-    
-    def test_salario_neto_positivo(self):
-        """Verifica que el salario neto nunca sea negativo"""
-        emp = EmpleadoAsalariado("001", "Juan Pérez", date(2020, 1, 1), 5_000_000)
-        salario_neto = emp.calcular_salario_neto()
-        assert salario_neto >= 0
-    
-    def test_salario_invalido(self):
-        """Verifica que no se pueda crear empleado con salario inválido"""
-        with pytest.raises(ValueError):
-            EmpleadoAsalariado("001", "Juan Pérez", date(2020, 1, 1), -1000)
+        deducciones = emp_asalariado_2020.calcular_deducciones(5_000_000)
+        assert deducciones == DEDUCCION_PCT * 5_000_000
+    
+    @settings(max_examples=50)
+    @given(salario=st.integers(1, 50_000_000), año=st.integers(1990, 2024))
+    def test_salario_neto_no_negativo(self, salario, año):
+        """Verifica que neto = bruto + beneficios - deducciones y nunca sea negativo"""
+        emp = EmpleadoAsalariado("001", "Juan Pérez", date(año, 1, 1), salario)
+        salario_bruto = emp.calcular_salario_bruto()
+        esperado = (salario_bruto + emp.calcular_beneficios()
+                    - emp.calcular_deducciones(salario_bruto))
+        assert emp.calcular_salario_neto() == esperado >= 0
 
 
 class TestEmpleadoPorHoras:
     """Pruebas para EmpleadoPorHoras"""
     
-    def test_creacion_empleado_por_horas(self):
+    def test_creacion_empleado_por_horas(self, emp_horas_2022):
         """Verifica que se puede crear un empleado por horas correctamente"""
-        emp = EmpleadoPorHoras("002", "María García", date(2022, 1, 1), 50_000, 40)
-        assert emp.nombre == "María García"
-        assert emp.tarifa_por_hora == 50_000
-        assert emp.horas_trabajadas == 40
+        assert emp_horas_2022.nombre == "María García"
+        assert emp_horas_2022.tarifa_por_hora == 50_000
+        assert emp_horas_2022.horas_trabajadas == 40
     
     def test_salario_sin_horas_extras(self):
         """Verifica el cálculo cuando NO hay horas extras"""
-        emp = EmpleadoPorHoras("002", "María García", date(2022, 1, 1), 50_000, 35)
+        tarifa, horas = 50_000, 35
+        emp = EmpleadoPorHoras("002", "María García", FECHA_INGRESO_2022, tarifa, horas)
         salario_bruto = emp.calcular_salario_bruto()
-        assert salario_bruto == 1_750_000  # 35 * 50K
+        assert salario_bruto == horas * tarifa
     
     def test_salario_con_horas_extras(self):
         """Verifica el cálculo con horas extras (1.5x)"""
-        emp = EmpleadoPorHoras("002", "María García", date(2022, 1, 1), 50_000, 45)
+        emp = EmpleadoPorHoras("002", "María García", FECHA_INGRESO_2022, 50_000, 45)
         salario_bruto = emp.calcular_salario_bruto()
-        # 40 horas normales (2M) + 5 extras a 1.5x (375K) = 2.375M
-        assert salario_bruto == 2_375_000
-    
-    def test_fondo_ahorro_con_mas_1_año(self):
-        """Verifica el fondo de ahorro si tiene más de 1 año y lo acepta"""
-        emp = EmpleadoPorHoras("002", "María García", date(2022, 1, 1), 50_000, 40, True)
-        beneficios = emp.calcular_beneficios()
-        # 2% de 2M = 40K
-        assert beneficios == 40_000
-    
-    def test_sin_fondo_ahorro_menos_1_año(self):
-        """Verifica que NO hay fondo si tiene menos de 1 año"""
-        emp = EmpleadoPorHoras("002", "María García", date(2024, 10, 1), 50_000, 40, True)
-        beneficios = emp.calcular_beneficios()
-        assert beneficios == 0
+        # 40 horas normales + 5 extras a 1.5x
+        assert salario_bruto == HORAS_STD * 50_000 + (45 - HORAS_STD) * 50_000 * MULT_EXT
     
-    def test_sin_fondo_ahorro_no_acepta(self):
-        """Verifica que NO hay fondo si no lo acepta"""
-        emp = EmpleadoPorHoras("002", "María García", date(2022, 1, 1), 50_000, 40, False)
-        beneficios = emp.calcular_beneficios()
-        assert beneficios == 0
+    @pytest.mark.parametrize("fecha_ingreso,acepta,esperado", [
+        # Más de 1 año y lo acepta: 2% del salario bruto (40 horas)
+        (FECHA_INGRESO_2022, True, FONDO_AHORRO_PCT * HORAS_STD * 50_000),
+        # Menos de 1 año
+        (date(2024, 10, 1), True, 0),
+        # No lo acepta
+        (FECHA_INGRESO_2022, False, 0),
+    ])
+    def test_fondo_ahorro(self, fecha_ingreso, acepta, esperado):
+        """Verifica que el fondo de ahorro exige más de 1 año y aceptarlo"""
+        emp = EmpleadoPorHoras("002", "María García", fecha_ingreso, 50_000, 40, acepta)
+        assert emp.calcular_beneficios() == esperado
     
-    def test_horas_negativas(self):
-        """Verifica que no se puedan ingresar horas negativas"""
-        with pytest.raises(ValueError):
-            EmpleadoPorHoras("002", "María García", date(2022, 1, 1), 50_000, -10)
+    def test_cambio_horas_recalcula_nomina(self):
+        """Verifica que modificar las horas recalcula la nómina memorizada"""
+        tarifa = 50_000
+        emp = EmpleadoPorHoras("002", "María García", FECHA_INGRESO_2022, tarifa, 35)
+        assert emp.calcular_nomina().salario_bruto == 35 * tarifa
+        emp.horas_trabajadas = 45
+        assert emp.calcular_salario_bruto() == (HORAS_STD * tarifa
+                                                + (45 - HORAS_STD) * tarifa * MULT_EXT)
+        assert emp.obtener_detalle_nomina()['horas_extras'] == 45 - HORAS_STD
 
 
 class TestEmpleadoPorComision:
     """Pruebas para EmpleadoPorComision"""
     
-    def test_creacion_empleado_comision(self):
+    def test_creacion_empleado_comision(self, emp_comision_low):
         """Verifica que se puede crear un empleado por comisión correctamente"""
-        emp = EmpleadoPorComision("003", "Carlos López", date(2020, 1, 1), 
-                                  2_000_000, 0.05, 15_000_000)
-        assert emp.nombre == "Carlos López"
-        assert emp.salario_base == 2_000_000
-        assert emp.porcentaje_comision == 0.05
+        assert emp_comision_low.nombre == "Carlos López"
+        assert emp_comision_low.salario_base == 2_000_000
+        assert emp_comision_low.porcentaje_comision == 0.05
     
     def test_salario_bruto_con_comision(self):
         """Verifica el cálculo de salario bruto (base + comisión)"""
-        emp = EmpleadoPorComision("003", "Carlos López", date(2020, 1, 1),
-                                  2_000_000, 0.05, 10_000_000)
+        salario_base, porcentaje, ventas = 2_000_000, 0.05, 10_000_000
+        emp = EmpleadoPorComision("003", "Carlos López", FECHA_INGRESO_2020,
+                                  salario_base, porcentaje, ventas)
         salario_bruto = emp.calcular_salario_bruto()
-        # 2M base + 5% de 10M (500K) = 2.5M
-        assert salario_bruto == 2_500_000
-    
-    def test_bono_ventas_altas(self):
-        """Verifica el bono adicional si ventas > $20M"""
-        emp = EmpleadoPorComision("003", "Carlos López", date(2020, 1, 1),
-                                  2_000_000, 0.05, 25_000_000)
-        beneficios = emp.calcular_beneficios()
-        # Bono alimentación (1M) + 3% de 25M (750K) = 1.75M
-        assert beneficios == 1_750_000
-    
-    def test_sin_bono_ventas_bajas(self):
-        """Verifica que NO hay bono adicional si ventas < $20M"""
-        emp = EmpleadoPorComision("003", "Carlos López", date(2020, 1, 1),
-                                  2_000_000, 0.05, 15_000_000)
-        beneficios = emp.calcular_beneficios()
-        # Solo bono alimentación (1M)
-        assert beneficios == 1_000_000
+        # Salario base + 5% de las ventas
+        assert salario_bruto == salario_base + porcentaje * ventas
     
-    def test_ventas_negativas(self):
-        """Verifica que no se puedan ingresar ventas negativas"""
-        with pytest.raises(ValueError):
-            EmpleadoPorComision("003", "Carlos López", date(2020, 1, 1),
-                               2_000_000, 0.05, -1000)
+    @pytest.mark.parametrize("ventas,esperado", [
+        # Ventas > $20M: bono alimentación + 3% de las ventas
+        (25_000_000, BONO_ALIM + COMISION_BONO_PCT * 25_000_000),
+        # Ventas en el umbral o por debajo: solo bono alimentación
+        (COMISION_BONO_UMBRAL, BONO_ALIM),
+        (15_000_000, BONO_ALIM),
+    ])
+    def test_bono_ventas(self, ventas, esperado):
+        """Verifica que el bono adicional solo se otorga si ventas > $20M"""
+        emp = EmpleadoPorComision("003", "Carlos López", FECHA_INGRESO_2020,
+                                  2_000_000, 0.05, ventas)
+        assert emp.calcular_beneficios() == esperado
+    
+    def test_cambio_ventas_recalcula_nomina(self):
+        """Verifica que modificar las ventas recalcula la nómina memorizada"""
+        emp = EmpleadoPorComision("003", "Carlos López", FECHA_INGRESO_2020,
+                                  2_000_000, 0.05, 15_000_000)
+        assert emp.calcular_nomina().beneficios == BONO_ALIM
+        emp.ventas_mes = 25_000_000
+        assert emp.calcular_beneficios() == BONO_ALIM + COMISION_BONO_PCT * 25_000_000
 
 
 class TestEmpleadoTemporal:
     """Pruebas para EmpleadoTemporal"""
     
-    def test_creacion_empleado_temporal(self):
+    def test_creacion_empleado_temporal(self, emp_temporal):
         """Verifica que se puede crear un empleado temporal correctamente"""
-        emp = EmpleadoTemporal("004", "Ana Ruiz", date(2024, 1, 1),
-                              3_000_000, date(2025, 12, 31))
-        assert emp.nombre == "Ana Ruiz"
-        assert emp.salario_mensual == 3_000_000
+        assert emp_temporal.nombre == "Ana Ruiz"
+        assert emp_temporal.salario_mensual == 3_000_000
     
-    def test_sin_beneficios_temporal(self):
+    def test_sin_beneficios_temporal(self, emp_temporal):
         """Verifica que los empleados temporales NO tienen beneficios"""
-        emp = EmpleadoTemporal("004", "Ana Ruiz", date(2024, 1, 1),
-                              3_000_000, date(2025, 12, 31))
-        beneficios = emp.calcular_beneficios()
+        beneficios = emp_temporal.calcular_beneficios()
         assert beneficios == 0
     
-    def test_contrato_vigente(self):
+    def test_contrato_vigente(self, emp_temporal):
         """Verifica que se puede consultar si el contrato está vigente"""
-        emp = EmpleadoTemporal("004", "Ana Ruiz", date(2024, 1, 1),
-                              3_000_000, date(2025, 12, 31))
-        assert emp.contrato_vigente() == True
+        assert emp_temporal.contrato_vigente() == True
     
-    def test_dias_restantes_contrato(self):
+    def test_dias_restantes_contrato(self, emp_temporal):
         """Verifica el cálculo de días restantes del contrato"""
-        emp = EmpleadoTemporal("004", "Ana Ruiz", date(2024, 1, 1),
-                              3_000_000, date(2025, 12, 31))
-        dias = emp.dias_restantes_contrato()
+        dias = emp_temporal.dias_restantes_contrato()
         assert dias > 0
     
-    def test_fecha_fin_invalida(self):
-        """Verifica que la fecha de fin debe ser posterior a la de inicio"""
-        with pytest.raises(ValueError):
-            EmpleadoTemporal("004", "Ana Ruiz", date(2024, 1, 1),
-                           3_000_000, date(2023, 12, 31))
+    def test_vigencia_fecha_referencia(self, emp_temporal):
+        """Verifica vigencia y días restantes respecto a una fecha dada"""
+        assert emp_temporal.dias_restantes_contrato(date(2025, 12, 1)) == 30
+        assert emp_temporal.contrato_vigente(FECHA_FIN_2025) == True
+        assert emp_temporal.dias_restantes_contrato(date(2026, 1, 1)) == -1
+        assert emp_temporal.contrato_vigente(date(2026, 1, 1)) == False
 
 
 class TestValidacionesGenerales:
     """Pruebas de validaciones generales para todos los empleados"""
     
-    def test_fecha_ingreso_futura(self):
-        """Verifica que no se puede ingresar una fecha futura"""
-        fecha_futura = date(2030, 1, 1)
+    @pytest.mark.parametrize("clase,argumentos", CASOS_INVALIDOS)
+    def test_rechaza_entrada_invalida(self, clase, argumentos):
+        """Verifica que no se pueda crear un empleado con datos inválidos"""
         with pytest.raises(ValueError):
-            EmpleadoAsalariado("001", "Juan Pérez", fecha_futura, 5_000_000)
+            clase(*argumentos)
     
-    def test_nombre_vacio(self):
-        """Verifica que el nombre no puede estar vacío"""
-        with pytest.raises(ValueError):
-            EmpleadoAsalariado("001", "", date(2020, 1, 1), 5_000_000)
+    def test_empleados_sin_dict(self, emp_asalariado_2020, emp_horas_2022,
+                                emp_comision_low, emp_temporal):
+        """Verifica que los empleados usan __slots__ y no crean __dict__"""
+        empleados = [emp_asalariado_2020, emp_horas_2022, emp_comision_low, emp_temporal]
+        for emp in empleados:
+            assert not hasattr(emp, '__dict__')
     
-    def test_id_vacio(self):
-        """Verifica que el ID no puede estar vacío"""
-        with pytest.raises(ValueError):
-            EmpleadoAsalariado("", "Juan Pérez", date(2020, 1, 1), 5_000_000)
\ No newline at end of file
+    def test_base_sin_implementacion(self):
+        """Verifica que la clase base exige implementar el salario bruto"""
+        emp = Empleado("005", "Rosa Díaz", FECHA_INGRESO_2020)
+        with pytest.raises(NotImplementedError):
+            emp.calcular_salario_neto()
+
+
+class TestNominaPorLotes:
+    """Pruebas del salario bruto por horas sobre muchos empleados a la vez"""
+    
+    N = 1000
+    
+    def test_salario_bruto_por_horas_vectorizado(self):
+        """Verifica el salario bruto de N empleados frente a la fórmula en NumPy"""
+        # NumPy se importa aquí para no cargarlo al recolectar el resto del módulo
+        import numpy as np
+        
+        rng = np.random.default_rng(2025)
+        tarifas = rng.integers(10, 101, size=self.N, dtype=np.int64) * 1_000
+        horas = rng.integers(0, 81, size=self.N, dtype=np.int64)
+        
+        # 40 horas a tarifa normal + horas extras a 1.5x
+        esperado = np.where(horas > HORAS_STD,
+                            HORAS_STD * tarifas + (horas - HORAS_STD) * tarifas * MULT_EXT,
+                            horas * tarifas)
+        
+        salarios = np.array([
+            EmpleadoPorHoras(f"{i:04d}", "María García", FECHA_INGRESO_2022,
+                             tarifa, hora).calcular_salario_bruto()
+            for i, (tarifa, hora) in enumerate(zip(tarifas.tolist(), horas.tolist()))
+        ])
+        np.testing.assert_array_equal(salarios, esperado)
\ No newline at end of file
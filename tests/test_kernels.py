@@ -0,0 +1,97 @@
+"""
+Pruebas unitarias para los kernels compilados con Numba.
+Verifica que replican las reglas de negocio de cada tipo de empleado.
+"""
+
+import numpy as np
+import pytest
+from datetime import date
+
+pytest.importorskip("numba")
+
+from src.models import _kernels, _coeficientes
+from src.services import nomina_batch
+from src.models.empleado_asalariado import EmpleadoAsalariado
+from src.models.empleado_por_horas import EmpleadoPorHoras
+from src.models.empleado_por_comision import EmpleadoPorComision
+from src.models.empleado_temporal import EmpleadoTemporal
+
+
+class TestKernels:
+    """Pruebas para los kernels escalares"""
+
+    @pytest.mark.parametrize("fecha_ingreso", [date(2018, 1, 1), date(2022, 1, 1)])
+    def test_neto_asalariado(self, fecha_ingreso):
+        """Verifica el neto con y sin bono por antigüedad"""
+        emp = EmpleadoAsalariado("001", "Juan Pérez", fecha_ingreso, 5_000_000)
+        neto = _kernels.neto_asalariado(_coeficientes.reglas_asalariado(),
+                                        emp.salario_mensual, emp.obtener_antiguedad_años())
+        assert neto == pytest.approx(emp.calcular_salario_neto())
+
+    @pytest.mark.parametrize("horas,acepta", [(35, True), (45, True), (45, False)])
+    def test_neto_por_horas(self, horas, acepta):
+        """Verifica el neto con horas extras y fondo de ahorro"""
+        emp = EmpleadoPorHoras("002", "María García", date(2022, 1, 1), 50_000, horas, acepta)
+        neto = _kernels.neto_por_horas(_coeficientes.reglas_por_horas(),
+                                       emp.tarifa_por_hora, emp.horas_trabajadas,
+                                       emp.obtener_antiguedad_años(), emp.acepta_fondo_ahorro)
+        assert neto == pytest.approx(emp.calcular_salario_neto())
+
+    @pytest.mark.parametrize("ventas", [15_000_000, 25_000_000])
+    def test_neto_por_comision(self, ventas):
+        """Verifica el neto con y sin bono por ventas altas"""
+        emp = EmpleadoPorComision("003", "Carlos López", date(2020, 1, 1),
+                                  2_000_000, 0.05, ventas)
+        neto = _kernels.neto_por_comision(_coeficientes.reglas_por_comision(),
+                                          emp.salario_base, emp.porcentaje_comision,
+                                          emp.ventas_mes)
+        assert neto == pytest.approx(emp.calcular_salario_neto())
+
+    def test_neto_temporal(self):
+        """Verifica el neto del empleado temporal"""
+        emp = EmpleadoTemporal("004", "Ana Ruiz", date(2024, 1, 1),
+                               3_000_000, date(2025, 12, 31))
+        neto = _kernels.neto_temporal(_coeficientes.reglas_temporal(), emp.salario_mensual)
+        assert neto == pytest.approx(emp.calcular_salario_neto())
+
+
+class TestKernelsLote:
+    """Pruebas para los kernels por lote frente a la versión con NumPy"""
+
+    def _comparar(self, kernel, kernel_numpy, reglas, *columnas):
+        """Ejecuta ambos kernels sobre las mismas reglas y columnas y compara los netos"""
+        netos = np.empty(len(columnas[0]))
+        esperado = np.empty(len(columnas[0]))
+        kernel(reglas, *columnas, netos)
+        kernel_numpy(reglas, *columnas, esperado)
+        np.testing.assert_allclose(netos, esperado)
+
+    def test_lote_asalariado(self):
+        """Verifica el lote de asalariados con y sin bono por antigüedad"""
+        self._comparar(_kernels.lote_neto_asalariado, nomina_batch._lote_neto_asalariado,
+                       _coeficientes.reglas_asalariado(),
+                       np.array([5_000_000.0, 4_500_000.0, 3_000_000.0]),
+                       np.array([7, 5, 0], dtype=np.int32))
+
+    def test_lote_por_horas(self):
+        """Verifica el lote por horas con horas extras y fondo de ahorro"""
+        self._comparar(_kernels.lote_neto_por_horas, nomina_batch._lote_neto_por_horas,
+                       _coeficientes.reglas_por_horas(),
+                       np.array([50_000.0, 45_000.0, 50_000.0]),
+                       np.array([45.0, 35.0, 40.0]),
+                       np.array([3, 3, 0], dtype=np.int32),
+                       np.array([True, False, True]))
+
+    def test_lote_por_comision(self):
+        """Verifica el lote por comisión con y sin bono por ventas"""
+        self._comparar(_kernels.lote_neto_por_comision, nomina_batch._lote_neto_por_comision,
+                       _coeficientes.reglas_por_comision(),
+                       np.array([2_000_000.0, 2_500_000.0]),
+                       np.array([0.05, 0.04]),
+                       np.array([25_000_000.0, 15_000_000.0]))
+
+    def test_lote_temporal(self):
+        """Verifica el lote de temporales"""
+        self._comparar(_kernels.lote_neto_temporal, nomina_batch._lote_neto_temporal,
+                       _coeficientes.reglas_temporal(),
+                       np.array([3_000_000.0, 1_000_000.0]))
@@ -0,0 +1,154 @@
+"""
+Pruebas unitarias para el cálculo de la nómina por lotes.
+Verifica que el cálculo vectorizado coincide con el cálculo por empleado.
+"""
+
+import numpy as np
+import pytest
+from datetime import date
+from src.models.empleado import Empleado
+from src.models.empleado_asalariado import EmpleadoAsalariado
+from src.models.empleado_por_horas import EmpleadoPorHoras
+from src.models.empleado_por_comision import EmpleadoPorComision
+from src.models.empleado_temporal import EmpleadoTemporal
+from src.services.nomina_batch import (
+    TablaNomina, calcular_total_nomina,
+    TIPO_OTRO, TIPO_ASALARIADO, TIPO_POR_HORAS, TIPO_POR_COMISION, TIPO_TEMPORAL
+)
+
+pytestmark = pytest.mark.usefixtures("congelar_hoy_lotes")
+
+# Salario mensual del asalariado 001 de la nómina de prueba
+SALARIO_ASALARIADO = 5_000_000
+
+# Parámetros de negocio con los que se calculan los valores esperados
+BONO_ALIM = 1_000_000
+TASA_ANT = 0.10
+DEDUCCION_PCT = 0.04
+
+# Columnas del desglose de conceptos en TablaNomina.detalle()
+CONCEPTOS = ('horas_normales', 'horas_extras', 'comision', 'bono_alimentacion',
+             'bono_antiguedad', 'bono_ventas', 'fondo_ahorro')
+
+
+class EmpleadoAsalariadoConPrima(EmpleadoAsalariado):
+    """Subclase sin kernel por lote: se calcula con su propio método"""
+
+    def calcular_salario_neto(self) -> float:
+        return super().calcular_salario_neto() + 100_000
+
+
+@pytest.fixture
+def empleados():
+    """Nómina con todos los tipos de empleados y casos con y sin bonos"""
+    return [
+        EmpleadoAsalariado("001", "Juan Pérez", date(2018, 1, 1), SALARIO_ASALARIADO),
+        EmpleadoPorHoras("002", "María García", date(2022, 1, 1), 50_000, 45, True),
+        EmpleadoAsalariado("003", "Luis Torres", date(2022, 1, 1), 4_500_000),
+        EmpleadoPorHoras("004", "Ana Martínez", date(2024, 10, 1), 45_000, 35, True),
+        EmpleadoPorComision("005", "Carlos López", date(2020, 1, 1),
+                            2_000_000, 0.05, 25_000_000),
+        EmpleadoPorComision("006", "Patricia Silva", date(2021, 9, 15),
+                            2_500_000, 0.04, 15_000_000),
+        EmpleadoTemporal("007", "Ana Ruiz", date(2024, 1, 1),
+                         3_000_000, date(2025, 12, 31)),
+    ]
+
+
+class TestNominaBatch:
+    """Pruebas para el cálculo de la nómina por lotes"""
+
+    def test_tabla_desde_empleados(self, empleados):
+        """Verifica que cada fila conserva el orden y la etiqueta de tipo"""
+        tabla = TablaNomina.desde_empleados(empleados)
+        assert len(tabla) == len(empleados)
+        assert list(tabla.tipo) == [TIPO_ASALARIADO, TIPO_POR_HORAS, TIPO_ASALARIADO,
+                                    TIPO_POR_HORAS, TIPO_POR_COMISION, TIPO_POR_COMISION,
+                                    TIPO_TEMPORAL]
+        assert tabla.salario[2] == 4_500_000
+        assert tabla.horas[1] == 45
+        assert tabla.ventas[4] == 25_000_000
+
+    def test_netos_coinciden_por_empleado(self, empleados):
+        """Verifica que cada salario neto vectorizado coincide con el individual"""
+        esperado = [emp.calcular_salario_neto() for emp in empleados]
+        netos = TablaNomina.desde_empleados(empleados).netos()
+        assert list(netos) == pytest.approx(esperado)
+
+    @pytest.mark.parametrize("clase,constante,valor", [
+        (Empleado, "PORCENTAJE_DEDUCCIONES", 0.08),
+        (EmpleadoAsalariado, "PORCENTAJE_BONO_ANTIGUEDAD", 0.20),
+        (EmpleadoAsalariado, "BONO_ALIMENTACION", 1_500_000),
+        (EmpleadoPorHoras, "HORAS_NORMALES_LIMITE", 36),
+        (EmpleadoPorHoras, "PORCENTAJE_FONDO_AHORRO", 0.05),
+        (EmpleadoPorComision, "VENTAS_MINIMAS_BONO", 10_000_000),
+    ])
+    def test_netos_siguen_cambio_de_regla(self, empleados, monkeypatch, clase, constante, valor):
+        """Verifica que los kernels usan las reglas vigentes y no las del caché de compilación"""
+        monkeypatch.setattr(clase, constante, valor)
+        esperado = [emp.calcular_salario_neto() for emp in empleados]
+        netos = TablaNomina.desde_empleados(empleados).netos()
+        assert list(netos) == pytest.approx(esperado)
+
+    def test_tipo_sin_kernel(self, empleados):
+        """Verifica que una clase sin kernel por lote usa calcular_salario_neto()"""
+        emp = EmpleadoAsalariadoConPrima("008", "Rosa Díaz", date(2020, 1, 1), 5_000_000)
+        tabla = TablaNomina.desde_empleados(empleados + [emp])
+        assert tabla.tipo[-1] == TIPO_OTRO
+        assert tabla.netos()[-1] == pytest.approx(emp.calcular_salario_neto())
+
+    def test_detalle_coincide_por_empleado(self, empleados):
+        """Verifica que el detalle por lote coincide con obtener_detalle_nomina()"""
+        detalle = TablaNomina.desde_empleados(empleados).detalle()
+        for fila, emp in zip(detalle, empleados):
+            esperado = emp.obtener_detalle_nomina()
+            nomina = emp.calcular_nomina()
+            assert fila['empleado'] == esperado['empleado']
+            assert fila['tipo'] == esperado['tipo']
+            assert fila['salario_bruto'] == pytest.approx(nomina.salario_bruto)
+            assert fila['beneficios'] == pytest.approx(nomina.beneficios)
+            assert fila['deducciones'] == pytest.approx(esperado['deducciones'])
+            assert fila['salario_neto'] == pytest.approx(esperado['salario_neto'])
+
+    def test_detalle_desglose_conceptos(self, empleados):
+        """Verifica el desglose por tipo, con NaN en los conceptos que no aplican"""
+        detalle = TablaNomina.desde_empleados(empleados).detalle()
+        for fila, emp in zip(detalle, empleados):
+            esperado = emp.obtener_detalle_nomina()
+            for nombre in CONCEPTOS:
+                if nombre in esperado:
+                    assert fila[nombre] == pytest.approx(esperado[nombre])
+                else:
+                    assert np.isnan(fila[nombre])
+
+    def test_detalle_neto_cuadra(self, empleados):
+        """Verifica que el neto sale exactamente de bruto + beneficios - deducciones"""
+        detalle = TablaNomina.desde_empleados(empleados).detalle()
+        neto = detalle['salario_bruto'] + detalle['beneficios'] - detalle['deducciones']
+        np.testing.assert_array_equal(detalle['salario_neto'], np.maximum(neto, 0.0))
+
+    def test_detalle_tipo_sin_kernel(self, empleados):
+        """Verifica que una fila TIPO_OTRO solo tiene salario neto"""
+        emp = EmpleadoAsalariadoConPrima("008", "Rosa Díaz", date(2020, 1, 1), 5_000_000)
+        fila = TablaNomina.desde_empleados(empleados + [emp]).detalle()[-1]
+        assert fila['tipo'] == 'Otro'
+        assert fila['salario_neto'] == pytest.approx(emp.calcular_salario_neto())
+        assert all(np.isnan(fila[nombre]) for nombre in ('salario_bruto', *CONCEPTOS))
+
+    def test_total_nomina(self, empleados):
+        """Verifica que el total coincide con la suma de salarios netos"""
+        esperado = sum(emp.calcular_salario_neto() for emp in empleados)
+        assert calcular_total_nomina(empleados) == pytest.approx(esperado)
+
+    def test_total_nomina_fecha_referencia(self, empleados):
+        """Verifica que la fecha de referencia decide el bono por antigüedad"""
+        asalariado = [empleados[0]]
+        sin_bono = SALARIO_ASALARIADO * (1 - DEDUCCION_PCT) + BONO_ALIM
+        con_bono = sin_bono + SALARIO_ASALARIADO * TASA_ANT
+        # Ingreso 2018-01-01: sin bono en 2023, con bono por antigüedad en 2024
+        assert calcular_total_nomina(asalariado, date(2023, 1, 1)) == pytest.approx(sin_bono)
+        assert calcular_total_nomina(asalariado, date(2024, 1, 1)) == pytest.approx(con_bono)
+
+    def test_total_nomina_vacia(self):
+        """Verifica que una nómina sin empleados suma cero"""
+        assert calcular_total_nomina([]) == 0